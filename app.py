@@ -8,50 +8,185 @@ Based on WebToEpub extension and fixTranslate.py
 Author: joelsnl and Anthropic Claude
 """
 
+from __future__ import annotations
+
 import os
 import sys
-import time
+import hashlib
+import functools
+import queue
 import threading
+import unicodedata
+import weakref
+import concurrent.futures
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 from io import BytesIO
+from itertools import compress
 
 import customtkinter as ctk
-from PIL import Image
-
-# Try curl_cffi for HTTP requests (better compatibility)
-try:
-    from curl_cffi.requests import Session as HttpSession
-    http_session = HttpSession(impersonate="chrome120")
-except ImportError:
-    import requests
-    http_session = requests.Session()
-    http_session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0'
-    })
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from core.parser import Chapter, NovelInfo, get_parser_for_url, cleanup_browser
-from core.cleaner import ContentCleaner
-from core.translator import GoogleTranslator
-from core.epub_builder import EPUBBuilder, TranslatedEPUBBuilder
+# Only what the window needs to appear is imported up front. The parsers
+# (lxml), cleaner, translator, EPUB builder and PIL are
+# imported where they are first used; see _load_parsers().
+from core.http import get_session
+from core.translation_cache import TranslationCache
 from core.updater import (
     get_current_version, check_for_updates_async, download_update_async,
-    get_auto_check_updates, set_auto_check_updates, is_frozen
+    get_auto_check_updates, set_auto_check_updates, is_frozen,
+    get_cache_dir, RELEASE_CACHE_MAX_AGE
 )
 
-# Import parsers to register them
-import parsers
+if TYPE_CHECKING:
+    from core.parser import Chapter, NovelInfo
+    from core.translator import GoogleTranslator
 
 
 # Set appearance
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Number of chapters fetched concurrently (request rate is still capped
+# by the parser's request_delay via RateLimiter)
+DOWNLOAD_WORKERS = 4
+
+# Requests allowed to start back to back after an idle spell (token-bucket
+# capacity); the sustained rate stays at one per request_delay
+DOWNLOAD_BURST = 4
+
+# Delay (ms) before queued progress/status updates from worker threads are
+# applied; everything posted in that window is coalesced into one pass
+UI_REFRESH_MS = 100
+
+# Smallest progress bar change worth queueing (0.5%)
+PROGRESS_STEP = 0.005
+
+# Background tasks (fetch, download, cover, title translation) share one pool
+APP_WORKERS = 8
+
+# Translation requests in flight when the workers entry is empty/invalid
+DEFAULT_TRANSLATION_WORKERS = 200
+
+# Novels fetched at the same time in multi mode
+MULTI_FETCH_WORKERS = 4
+
+# Threads in the shared network I/O pool (chapter fetches, multi-mode fetches)
+IO_WORKERS = max(DOWNLOAD_WORKERS, MULTI_FETCH_WORKERS)
+
+# Size cap for the on-disk chapter cache; least recently used chapters
+# are deleted past it
+CHAPTER_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Check marks shown in the chapter list
+CHECK_ON = "\u2611"
+CHECK_OFF = "\u2610"
+
+# Byte table flipping selection flags 0 <-> 1
+_INVERT_SELECTION = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+# Non-alphanumeric characters allowed in generated filenames
+_FILENAME_EXTRA_CHARS = frozenset(" ._-")
+
+
+class _FilenameTable(dict):
+    """
+    str.translate table that keeps letters, digits and " ._-" and drops
+    everything else. Entries are filled in on first sight of a character,
+    so CJK titles don't need a table covering all of Unicode.
+    """
+    
+    def __missing__(self, code: int):
+        char = chr(code)
+        keep = char if char.isalnum() or char in _FILENAME_EXTRA_CHARS else None
+        self[code] = keep
+        return keep
+
+
+_FILENAME_TABLE = _FilenameTable()
+
+
+def _prune_cache_dir(path: Path, max_bytes: int):
+    """Delete the least recently used files under path until it fits max_bytes (to 90%)."""
+    entries = []
+    total = 0
+    try:
+        for sub in os.scandir(path):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+    except OSError:
+        return
+    if total <= max_bytes:
+        return
+    
+    entries.sort()
+    target = max_bytes * 0.9
+    removed = 0
+    for _, size, file_path in entries:
+        if total <= target:
+            break
+        try:
+            os.remove(file_path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    print(f"Cache {path.name}: removed {removed} old files")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_parsers():
+    """Import core.parser and register the site parsers (once); returns core.parser."""
+    import parsers  # noqa: F401 - importing registers every parser
+    from core import parser
+    return parser
+
+
+@functools.lru_cache(maxsize=256)
+def _short_filename(title: str, max_length: int) -> str:
+    """Cached worker for NovelDownloaderApp._create_short_filename."""
+    # Clean the title - keep only safe characters (NFKC folds
+    # full-width letters/digits to their ASCII forms first)
+    clean = unicodedata.normalize("NFKC", title).translate(_FILENAME_TABLE)
+    
+    # Split once; also collapses runs of whitespace
+    words = clean.split()
+    clean = " ".join(words)
+    
+    if not clean:
+        return "novel"
+    
+    # If short enough, return as-is
+    if len(clean) <= max_length:
+        return clean
+    
+    if len(words) <= 2:
+        # Just truncate if only 1-2 words
+        return clean[:max_length]
+    
+    # Take first 2 words and last word, join with "..."
+    first_part = " ".join(words[:2])
+    last_part = words[-1]
+    
+    # Format: "First Two...Last"
+    shortened = f"{first_part}...{last_part}"
+    
+    # If still too long, truncate first part
+    if len(shortened) > max_length:
+        available = max_length - len(last_part) - 3  # 3 for "..."
+        first_part = first_part[:available].rstrip()
+        shortened = f"{first_part}...{last_part}"
+    
+    return shortened
+
 
 class NovelDownloaderApp(ctk.CTk):
     """Main application window."""
@@ -59,12 +194,27 @@ class NovelDownloaderApp(ctk.CTk):
     def __init__(self):
         super().__init__()
         
-        self.title(f"Novel Downloader & Translator v{get_current_version()}")
+        # Read once; used by the title bar, footer and startup update check
+        self._version = get_current_version()
+        self._auto_check = get_auto_check_updates()
+        
+        self.title(f"Novel Downloader & Translator v{self._version}")
         self.geometry("900x700")
         self.minsize(800, 600)
         
         # Get app directory for auto-save
         self.app_dir = Path(os.path.dirname(os.path.abspath(__file__)))
+        # Caches go in a per-user directory: app_dir is a temp folder that
+        # is deleted on exit in a --onefile build
+        self.cache_dir = get_cache_dir()
+        
+        # Translations persist between runs so re-downloads skip Google
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.translation_cache = TranslationCache(self.cache_dir / "tx_cache.sqlite")
+        except Exception as e:
+            print(f"Translation cache unavailable: {e}")
+            self.translation_cache = None
         
         # State
         self.novel_info: Optional[NovelInfo] = None
@@ -72,9 +222,40 @@ class NovelDownloaderApp(ctk.CTk):
         self.parser = None
         self.is_downloading = False
         self.cancel_requested = False
+        self._cancel_event = threading.Event()  # Set with cancel_requested; wakes rate-limit waits
         self.cover_image = None  # Store PhotoImage reference
         self.translated_title = None  # Store translated title
         
+        # Progress/status updates posted by worker threads (via _post_ui);
+        # at most one drain is scheduled at a time, so only the latest value
+        # per tick reaches Tk and an idle app runs no timer
+        self._ui_queue: queue.Queue = queue.Queue()
+        self._ui_drain_scheduled = False
+        self._ui_lock = threading.Lock()
+        
+        # Title translations: one shared translator, results memoized per session
+        self._title_translator: Optional[GoogleTranslator] = None
+        self._title_translations: dict = {}
+        self._title_lock = threading.Lock()
+        
+        # Download translators still alive, so a cancel or window close can
+        # stop them mid-backoff instead of waiting for a progress callback
+        self._translators = weakref.WeakSet()
+        self._translators_lock = threading.Lock()
+        
+        # Info label updates waiting for the next idle pass (label -> options)
+        self._pending_info: dict = {}
+        
+        # Shared worker pool for fetch/download/cover/title background tasks
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=APP_WORKERS, thread_name_prefix="app"
+        )
+        # Long-lived pool that runs the individual network requests (chapter
+        # pages, multi-mode novel fetches) for those tasks
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=IO_WORKERS, thread_name_prefix="io"
+        )
+        
         # Multi-download mode state
         self.multi_mode = False
         self.multi_url_entries: List[ctk.CTkEntry] = []
@@ -84,21 +265,74 @@ class NovelDownloaderApp(ctk.CTk):
         # Create UI
         self._create_ui()
         
+        # Load the parsers off the UI thread once the window is up, so the
+        # first Fetch click doesn't stall on the import
+        self.after(500, lambda: self._pool.submit(_load_parsers))
+        
         # Cleanup browser on close
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Auto-check for updates on startup (if enabled)
-        if get_auto_check_updates():
+        if self._auto_check:
             self.after(2000, self._auto_check_updates)  # Check after 2 seconds
     
     def _on_close(self):
-        """Handle window close - cleanup browser."""
-        try:
-            cleanup_browser()
-        except:
-            pass
+        """Handle window close - stop background work and cleanup browser."""
+        # Pool threads aren't daemons; stop running tasks so exit isn't held
+        # up. _cancel_event also wakes the parsers' retry waits.
+        self.cancel_requested = True
+        self._cancel_event.set()
+        self._cancel_translators()
+        if self._title_translator is not None:
+            self._title_translator.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        # Nothing to clean up if no fetch ever loaded the parsers
+        parser_module = sys.modules.get("core.parser")
+        if parser_module is not None:
+            try:
+                parser_module.cleanup_browser()
+            except:
+                pass
+        # Workers may still be reading/writing the translation cache; close
+        # it once they have finished
+        threading.Thread(target=self._close_when_idle, name="shutdown").start()
         self.destroy()
     
+    def _close_when_idle(self):
+        """Wait for the worker pools to finish, then close the translators and translation cache."""
+        self._pool.shutdown(wait=True)
+        self._io_pool.shutdown(wait=True)
+        with self._translators_lock:
+            translators = list(self._translators)
+        if self._title_translator is not None:
+            translators.append(self._title_translator)
+        for translator in translators:
+            translator.close()
+        if self.translation_cache:
+            try:
+                self.translation_cache.close()
+            except Exception:
+                pass
+    
+    def _new_translator(self):
+        """Create a download translator that _cancel_translators() can reach."""
+        from core.translator import GoogleTranslator
+        translator = GoogleTranslator(max_workers=self._workers, persistent_cache=self.translation_cache)
+        with self._translators_lock:
+            self._translators.add(translator)
+        # A cancel that landed while we were starting up still applies
+        if self.cancel_requested:
+            translator.cancel()
+        return translator
+    
+    def _cancel_translators(self):
+        """Cancel every live download translator (wakes their retry waits)."""
+        with self._translators_lock:
+            translators = list(self._translators)
+        for translator in translators:
+            translator.cancel()
+    
     def _create_ui(self):
         """Create all UI elements."""
         
@@ -181,13 +415,34 @@ class NovelDownloaderApp(ctk.CTk):
         self.selected_label = ctk.CTkLabel(btn_frame, text="Selected: 0")
         self.selected_label.pack(side="right", padx=10)
         
-        # Chapter listbox with checkboxes
-        self.chapter_frame = ctk.CTkScrollableFrame(self.list_frame)
+        # Chapter list - a Treeview only draws the visible rows, so long
+        # novels don't need one Tk widget per chapter
+        self.chapter_frame = ctk.CTkFrame(self.list_frame)
         self.chapter_frame.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
         self.chapter_frame.grid_columnconfigure(0, weight=1)
+        self.chapter_frame.grid_rowconfigure(0, weight=1)
+        
+        self._style_chapter_tree()
+        self.chapter_tree = ttk.Treeview(
+            self.chapter_frame,
+            columns=("check", "title"),
+            show="headings",
+            selectmode="none",
+            style="Chapters.Treeview"
+        )
+        self.chapter_tree.heading("check", text="")
+        self.chapter_tree.heading("title", text="Chapter", anchor="w")
+        self.chapter_tree.column("check", width=40, minwidth=40, stretch=False, anchor="center")
+        self.chapter_tree.column("title", anchor="w")
+        self.chapter_tree.grid(row=0, column=0, padx=(5, 0), pady=5, sticky="nsew")
+        self.chapter_tree.bind("<Button-1>", self._on_chapter_click)
         
-        self.chapter_vars: List[ctk.BooleanVar] = []
-        self.chapter_checkboxes: List[ctk.CTkCheckBox] = []
+        chapter_scroll = ctk.CTkScrollbar(self.chapter_frame, command=self.chapter_tree.yview)
+        chapter_scroll.grid(row=0, column=1, padx=(0, 5), pady=5, sticky="ns")
+        self.chapter_tree.configure(yscrollcommand=chapter_scroll.set)
+        
+        # Selection state: one byte per chapter (1 = selected)
+        self._sel = bytearray()
         
         # === Multi Mode UI (hidden by default) ===
         self.multi_frame = ctk.CTkFrame(self)
@@ -264,15 +519,25 @@ class NovelDownloaderApp(ctk.CTk):
         self.translate_var = ctk.BooleanVar(value=True)
         ctk.CTkCheckBox(left_opts, text="Translate to English", variable=self.translate_var).pack(anchor="w", pady=2)
         
+        self.chapter_cache_var = ctk.BooleanVar(value=True)
+        ctk.CTkCheckBox(left_opts, text="Reuse downloaded chapters", variable=self.chapter_cache_var).pack(anchor="w", pady=2)
+        
         # Right side - workers
         right_opts = ctk.CTkFrame(options_frame, fg_color="transparent")
         right_opts.pack(side="right", padx=10, pady=10)
         
         ctk.CTkLabel(right_opts, text="Translation Workers:").pack(side="left", padx=5)
         self.workers_entry = ctk.CTkEntry(right_opts, width=60)
-        self.workers_entry.insert(0, "200")
+        self.workers_entry.insert(0, str(DEFAULT_TRANSLATION_WORKERS))
         self.workers_entry.pack(side="left", padx=5)
         
+        # Parse the worker count as it's typed so download threads just read an int
+        self._workers = DEFAULT_TRANSLATION_WORKERS
+        self.workers_entry.configure(
+            validate="key",
+            validatecommand=(self.register(self._validate_workers), "%P")
+        )
+        
         # === Progress Section ===
         progress_frame = ctk.CTkFrame(self)
         progress_frame.grid(row=4, column=0, padx=10, pady=5, sticky="ew")
@@ -319,7 +584,7 @@ class NovelDownloaderApp(ctk.CTk):
         # Version label on left
         self.version_label = ctk.CTkLabel(
             footer_frame, 
-            text=f"v{get_current_version()}", 
+            text=f"v{self._version}", 
             font=("", 11),
             text_color="gray"
         )
@@ -330,7 +595,7 @@ class NovelDownloaderApp(ctk.CTk):
         update_frame.pack(side="right", padx=10)
         
         # Auto-update checkbox
-        self.auto_update_var = ctk.BooleanVar(value=get_auto_check_updates())
+        self.auto_update_var = ctk.BooleanVar(value=self._auto_check)
         self.auto_update_cb = ctk.CTkCheckBox(
             update_frame, 
             text="Auto-check updates",
@@ -353,6 +618,35 @@ class NovelDownloaderApp(ctk.CTk):
         )
         self.update_btn.pack(side="left")
     
+    def _style_chapter_tree(self):
+        """Style ttk.Treeview to match the CustomTkinter theme."""
+        theme = ctk.ThemeManager.theme
+        bg = self._apply_appearance_mode(theme["CTkFrame"]["fg_color"])
+        fg = self._apply_appearance_mode(theme["CTkLabel"]["text_color"])
+        heading_bg = self._apply_appearance_mode(theme["CTkFrame"]["top_fg_color"])
+        
+        style = ttk.Style(self)
+        style.theme_use("default")  # Native themes ignore custom colors
+        style.configure(
+            "Chapters.Treeview",
+            background=bg, fieldbackground=bg, foreground=fg,
+            borderwidth=0, rowheight=26
+        )
+        style.configure(
+            "Chapters.Treeview.Heading",
+            background=heading_bg, foreground=fg, relief="flat"
+        )
+        style.map("Chapters.Treeview.Heading", background=[("active", heading_bg)])
+        style.layout("Chapters.Treeview", [("Treeview.treearea", {"sticky": "nswe"})])
+    
+    def _validate_workers(self, proposed: str) -> bool:
+        """Accept only digits in the workers entry and keep the parsed value."""
+        if proposed and not proposed.isdigit():
+            return False
+        value = int(proposed) if proposed else 0
+        self._workers = value if value > 0 else DEFAULT_TRANSLATION_WORKERS
+        return True
+    
     def _on_fetch(self):
         """Handle fetch button click."""
         url = self.url_entry.get().strip()
@@ -361,10 +655,14 @@ class NovelDownloaderApp(ctk.CTk):
             return
         
         # Find appropriate parser
-        self.parser = get_parser_for_url(url)
+        self.parser = _load_parsers().get_parser_for_url(url)
         if not self.parser:
             messagebox.showerror("Error", f"Unsupported site. URL: {url}")
             return
+        # A cancelled download leaves the event set; it must not cut this
+        # fetch's retries short (fetch is disabled while downloading)
+        self._cancel_event.clear()
+        self.parser.cancel_event = self._cancel_event
         
         # Disable UI
         self.fetch_btn.configure(state="disabled")
@@ -372,9 +670,7 @@ class NovelDownloaderApp(ctk.CTk):
         self.progress_bar.set(0)
         
         # Run in thread
-        thread = threading.Thread(target=self._fetch_thread, args=(url,))
-        thread.daemon = True
-        thread.start()
+        self._pool.submit(self._fetch_thread, url)
     
     def _fetch_thread(self, url: str):
         """Fetch novel info in background thread."""
@@ -382,7 +678,7 @@ class NovelDownloaderApp(ctk.CTk):
             # Check if parser supports parallel fetching (faster)
             if hasattr(self.parser, 'fetch_all_parallel'):
                 print(f"Fetching novel info and chapters in parallel...")
-                self.after(0, lambda: self._update_status("Fetching novel info & chapters (parallel)..."))
+                self._post_ui(('status', "Fetching novel info & chapters (parallel)..."))
                 self.novel_info, self.chapters = self.parser.fetch_all_parallel(url)
                 print(f"Got novel info: {self.novel_info.title}")
                 print(f"Got {len(self.chapters)} chapters")
@@ -391,7 +687,7 @@ class NovelDownloaderApp(ctk.CTk):
                 print(f"Fetching novel info from: {url}")
                 self.novel_info = self.parser.get_novel_info(url)
                 print(f"Got novel info: {self.novel_info.title}")
-                self.after(0, lambda: self._update_status("Fetching chapter list..."))
+                self._post_ui(('status', "Fetching chapter list..."))
                 
                 print("Fetching chapter list...")
                 self.chapters = self.parser.get_chapter_list(url)
@@ -414,64 +710,87 @@ class NovelDownloaderApp(ctk.CTk):
             return
         
         # Update info labels
-        self.title_label.configure(text=self.novel_info.title)
-        self.author_label.configure(text=self.novel_info.author)
-        self.chapters_label.configure(text=str(len(self.chapters)))
+        self._queue_info(self.title_label, text=self.novel_info.title)
+        self._queue_info(self.author_label, text=self.novel_info.author)
+        self._queue_info(self.chapters_label, text=str(len(self.chapters)))
         
         # Load cover image in background
         if self.novel_info.cover_url:
-            thread = threading.Thread(target=self._load_cover, args=(self.novel_info.cover_url,))
-            thread.daemon = True
-            thread.start()
+            self._pool.submit(self._load_cover, self.novel_info.cover_url)
         
         # Translate title in background
-        thread = threading.Thread(target=self._translate_title, args=(self.novel_info.title,))
-        thread.daemon = True
-        thread.start()
-        
-        # Clear existing checkboxes
-        for cb in self.chapter_checkboxes:
-            cb.destroy()
-        self.chapter_vars.clear()
-        self.chapter_checkboxes.clear()
+        self._pool.submit(self._translate_title, self.novel_info.title)
+        
+        # Reuse the existing rows (iids are "0".."n-1") and only insert or
+        # delete the difference, so refetching a long novel doesn't tear
+        # down and rebuild thousands of rows. All selected by default.
+        tree = self.chapter_tree
+        old_count = len(tree.get_children())
+        new_count = len(self.chapters)
+        if old_count > new_count:
+            tree.delete(*(str(idx) for idx in range(new_count, old_count)))
+        self._sel = bytearray(b'\x01') * new_count
         
-        # Add chapter checkboxes
         for idx, chapter in enumerate(self.chapters):
-            var = ctk.BooleanVar(value=True)
-            self.chapter_vars.append(var)
-            
-            cb = ctk.CTkCheckBox(
-                self.chapter_frame,
-                text=f"{idx + 1}. {chapter.title[:60]}{'...' if len(chapter.title) > 60 else ''}",
-                variable=var,
-                command=self._update_selected_count
-            )
-            cb.grid(row=idx, column=0, padx=5, pady=2, sticky="w")
-            self.chapter_checkboxes.append(cb)
+            text = f"{idx + 1}. {chapter.title[:60]}{'...' if len(chapter.title) > 60 else ''}"
+            if idx < old_count:
+                tree.item(str(idx), values=(CHECK_ON, text))
+            else:
+                tree.insert("", "end", iid=str(idx), values=(CHECK_ON, text))
+        tree.yview_moveto(0)
         
         self._update_selected_count()
         self.download_btn.configure(state="normal")
         self._update_status(f"Found {len(self.chapters)} chapters. Ready to download.")
     
+    def _queue_info(self, label, **options):
+        """Queue a label configure; all queued labels are applied together when idle."""
+        if not self._pending_info:
+            self.after_idle(self._commit_info)
+        self._pending_info.setdefault(label, {}).update(options)
+    
+    def _commit_info(self):
+        """Apply queued label updates in one pass so the wrapped labels reflow once."""
+        pending, self._pending_info = self._pending_info, {}
+        for label, options in pending.items():
+            label.configure(**options)
+    
+    def _on_chapter_click(self, event):
+        """Toggle a chapter's selection when its row is clicked."""
+        if self.chapter_tree.identify_region(event.x, event.y) != "cell":
+            return None  # Let headings/separators handle their own clicks
+        
+        iid = self.chapter_tree.identify_row(event.y)
+        if iid:
+            idx = int(iid)
+            self._sel[idx] ^= 1
+            self.chapter_tree.set(iid, "check", CHECK_ON if self._sel[idx] else CHECK_OFF)
+            self._update_selected_count()
+        return "break"
+    
+    def _refresh_chapter_checks(self):
+        """Redraw all check marks from the selection state."""
+        tree = self.chapter_tree
+        for idx, selected in enumerate(self._sel):
+            tree.set(str(idx), "check", CHECK_ON if selected else CHECK_OFF)
+        self._update_selected_count()
+    
     def _update_selected_count(self):
         """Update the selected count label."""
-        count = sum(1 for var in self.chapter_vars if var.get())
+        count = self._sel.count(1)
         self.selected_label.configure(text=f"Selected: {count}")
     
     def _select_all(self):
-        for var in self.chapter_vars:
-            var.set(True)
-        self._update_selected_count()
+        self._sel[:] = b'\x01' * len(self._sel)
+        self._refresh_chapter_checks()
     
     def _select_none(self):
-        for var in self.chapter_vars:
-            var.set(False)
-        self._update_selected_count()
+        self._sel[:] = b'\x00' * len(self._sel)
+        self._refresh_chapter_checks()
     
     def _invert_selection(self):
-        for var in self.chapter_vars:
-            var.set(not var.get())
-        self._update_selected_count()
+        self._sel = self._sel.translate(_INVERT_SELECTION)
+        self._refresh_chapter_checks()
     
     def _on_download(self):
         """Handle download button click."""
@@ -479,9 +798,7 @@ class NovelDownloaderApp(ctk.CTk):
             return
         
         # Get selected chapters
-        selected_chapters = [
-            self.chapters[i] for i, var in enumerate(self.chapter_vars) if var.get()
-        ]
+        selected_chapters = list(compress(self.chapters, self._sel))
         
         if not selected_chapters:
             messagebox.showwarning("Warning", "Please select at least one chapter")
@@ -491,37 +808,36 @@ class NovelDownloaderApp(ctk.CTk):
         title_for_filename = self.translated_title if self.translated_title else self.novel_info.title
         
         # Create shortened filename like WebToEpub: "First...Last.epub"
+        # (never empty: it falls back to "novel")
         clean_title = self._create_short_filename(title_for_filename)
         
-        if not clean_title:
-            clean_title = "novel"
-        
         # Save to central Downloads directory
         downloads_dir = self._get_downloads_folder()
-        output_path = str(downloads_dir / f"{clean_title}.epub")
         
-        # If file exists, add number
+        # If file exists, add number - list the folder once and pick the
+        # first free name in memory instead of stat'ing each candidate
+        try:
+            existing = {entry.name for entry in os.scandir(downloads_dir)}
+        except OSError:
+            existing = set()
+        filename = f"{clean_title}.epub"
         counter = 1
-        base_path = output_path
-        while os.path.exists(output_path):
-            output_path = base_path.replace(".epub", f" ({counter}).epub")
+        while filename in existing:
+            filename = f"{clean_title} ({counter}).epub"
             counter += 1
+        output_path = str(downloads_dir / filename)
         
         print(f"Auto-saving to: {output_path}")
         
         # Start download
         self.is_downloading = True
         self.cancel_requested = False
+        self._cancel_event.clear()
         self.download_btn.configure(state="disabled")
         self.cancel_btn.configure(state="normal")
         self.fetch_btn.configure(state="disabled")
         
-        thread = threading.Thread(
-            target=self._download_thread,
-            args=(selected_chapters, output_path)
-        )
-        thread.daemon = True
-        thread.start()
+        self._pool.submit(self._download_thread, selected_chapters, output_path)
     
     def _get_downloads_folder(self) -> Path:
         """Get the user's Downloads folder."""
@@ -544,84 +860,40 @@ class NovelDownloaderApp(ctk.CTk):
         Create a shortened filename like WebToEpub does.
         Format: "FirstWord...LastWord" if title is too long.
         """
-        # Clean the title - keep only safe characters
-        clean = "".join(c for c in title if c.isalnum() or c in " ._-").strip()
-        
-        # Replace multiple spaces with single space
-        clean = " ".join(clean.split())
-        
-        if not clean:
-            return "novel"
-        
-        # If short enough, return as-is
-        if len(clean) <= max_length:
-            return clean
-        
-        # Split into words
-        words = clean.split()
-        
-        if len(words) <= 2:
-            # Just truncate if only 1-2 words
-            return clean[:max_length]
-        
-        # Take first 2 words and last word, join with "..."
-        first_part = " ".join(words[:2])
-        last_part = words[-1]
-        
-        # Format: "First Two...Last"
-        shortened = f"{first_part}...{last_part}"
-        
-        # If still too long, truncate first part
-        if len(shortened) > max_length:
-            available = max_length - len(last_part) - 3  # 3 for "..."
-            first_part = first_part[:available].rstrip()
-            shortened = f"{first_part}...{last_part}"
-        
-        return shortened
+        return _short_filename(title, max_length)
     
     def _download_thread(self, chapters: List[Chapter], output_path: str):
         """Download and build EPUB in background thread."""
+        from core.cleaner import ContentCleaner
+        from core.epub_builder import EPUBBuilder, TranslatedEPUBBuilder
+        
+        # Bound once; called for every chapter and translation step
+        ui_put = self._post_ui
+        translator = None
+        
         try:
             total = len(chapters)
             delay = self.parser.request_delay
             
             # Phase 1: Download chapter content
-            self.after(0, lambda: self._update_status(f"Downloading chapters ({delay}s delay between requests)..."))
+            ui_put(('status', f"Downloading chapters ({delay}s between requests)..."))
             
-            for idx, chapter in enumerate(chapters):
-                if self.cancel_requested:
-                    self.after(0, lambda: self._update_status("Cancelled"))
-                    return
-                
-                progress = (idx + 1) / (total * 2)  # First half is download
-                self.after(0, lambda p=progress: self.progress_bar.set(p))
-                self.after(0, lambda i=idx, t=chapter.title: self._update_status(
-                    f"Downloading [{i+1}/{total}]: {t[:40]}..."
-                ))
-                
-                # Fetch chapter content
-                chapter.content = self.parser.get_chapter_content(chapter)
-                
-                # Delay to avoid rate limiting (shows in status)
-                if idx < total - 1:  # Don't wait after last chapter
-                    self.after(0, lambda i=idx, d=delay: self._update_status(
-                        f"Downloaded [{i+1}/{total}] - waiting {d}s..."
-                    ))
-                    time.sleep(delay)
+            def on_chapter_done(done, chapter):
+                ui_put(('progress', done / (total * 2)))  # First half is download
+                ui_put(('status', f"Downloading [{done}/{total}]: {chapter.title[:40]}..."))
+            
+            if not self._download_chapters(self.parser, chapters, on_chapter_done):
+                ui_put(('status', "Cancelled"))
+                return
             
             # Phase 2: Build EPUB
-            self.after(0, lambda: self._update_status("Building EPUB..."))
+            ui_put(('status', "Building EPUB..."))
             
             # Create cleaner and translator
             cleaner = ContentCleaner() if self.clean_var.get() else None
-            translator = None
             
             if self.translate_var.get():
-                try:
-                    workers = int(self.workers_entry.get())
-                except ValueError:
-                    workers = 200
-                translator = GoogleTranslator(max_workers=workers)
+                translator = self._new_translator()
 
             # Build EPUB
             if translator:
@@ -631,48 +903,139 @@ class NovelDownloaderApp(ctk.CTk):
                     if self.cancel_requested:
                         translator.cancel()
                         return
-                    progress = 0.5 + (current / total_steps) * 0.5
-                    self.after(0, lambda p=progress: self.progress_bar.set(p))
-                    self.after(0, lambda s=status: self._update_status(s))
+                    ui_put(('progress', 0.5 + (current / total_steps) * 0.5))
+                    ui_put(('status', status))
                 
                 builder.build_with_translation(
                     self.novel_info,
                     chapters,
                     output_path,
-                    progress_cb
+                    progress_cb,
+                    release_content=True
                 )
             else:
                 builder = EPUBBuilder(cleaner=cleaner)
                 
                 def progress_cb(current, total_steps, status):
-                    progress = 0.5 + (current / total_steps) * 0.5
-                    self.after(0, lambda p=progress: self.progress_bar.set(p))
-                    self.after(0, lambda s=status: self._update_status(s))
+                    ui_put(('progress', 0.5 + (current / total_steps) * 0.5))
+                    ui_put(('status', status))
                 
                 builder.build(
                     self.novel_info,
                     chapters,
                     output_path,
-                    progress_cb
+                    progress_cb,
+                    release_content=True
                 )
             
             # Done
-            self.after(0, lambda: self.progress_bar.set(1.0))
-            self.after(0, lambda: self._update_status(f"Done! Saved to: {output_path}"))
+            ui_put(('progress', 1.0))
+            ui_put(('status', f"Done! Saved to: {output_path}"))
             self.after(0, lambda: messagebox.showinfo("Success", f"EPUB saved to:\n{output_path}"))
             
         except Exception as e:
             error_msg = f"Download failed: {str(e)}"
             self.after(0, lambda msg=error_msg: self._show_error(msg))
         finally:
+            if translator is not None:
+                translator.close()
             self.is_downloading = False
-            self.after(0, lambda: self.download_btn.configure(state="normal"))
-            self.after(0, lambda: self.cancel_btn.configure(state="disabled"))
-            self.after(0, lambda: self.fetch_btn.configure(state="normal"))
+            self.after(0, self._reset_download_buttons)
+    
+    def _reset_download_buttons(self):
+        """Re-enable fetch/download and disable cancel after a download ends."""
+        self.download_btn.configure(state="normal")
+        self.cancel_btn.configure(state="disabled")
+        self.fetch_btn.configure(state="normal")
+    
+    def _download_chapters(self, parser, chapters: List[Chapter], on_chapter_done) -> bool:
+        """
+        Fetch content for all chapters on the shared I/O pool, up to
+        DOWNLOAD_WORKERS at a time.
+        
+        Workers share a RateLimiter so requests are still spaced by
+        parser.request_delay, but network round-trips overlap instead of
+        running back to back. Content is stored on each Chapter object, so
+        list order is kept whatever order the fetches finish in.
+        Calls on_chapter_done(done_count, chapter) as each chapter
+        finishes. Returns False if cancelled.
+        
+        Fetched chapters are kept in the user cache dir (chapters/, capped
+        at CHAPTER_CACHE_MAX_BYTES), so re-running a failed or cancelled
+        download only fetches what is still missing.
+        """
+        limiter = _load_parsers().RateLimiter(parser.request_delay, capacity=DOWNLOAD_BURST)
+        cache_dir = self.cache_dir / "chapters" if self.chapter_cache_var.get() else None
+        if cache_dir is not None:
+            _prune_cache_dir(cache_dir, CHAPTER_CACHE_MAX_BYTES)
+        
+        def fetch(chapter: Chapter) -> Optional[str]:
+            cache_file = None
+            if cache_dir is not None:
+                key = hashlib.blake2b(chapter.url.encode("utf-8"), digest_size=16).hexdigest()
+                cache_file = cache_dir / key[:2] / key
+                try:
+                    content = cache_file.read_text(encoding="utf-8")
+                    os.utime(cache_file)  # Mark as recently used for pruning
+                    return content
+                except OSError:
+                    pass  # Not cached yet
+            
+            if not limiter.acquire(self._cancel_event):
+                return None
+            content = parser.get_chapter_content(chapter)
+            
+            # Don't cache the parsers' "Failed to extract" placeholder
+            if cache_file is not None and content and not content.startswith("<p>Failed to extract"):
+                try:
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    part_file = cache_file.with_suffix(".part")
+                    part_file.write_text(content, encoding="utf-8")
+                    part_file.replace(cache_file)
+                except OSError as e:
+                    print(f"Could not cache chapter: {e}")
+            return content
+        
+        # Keep only a few chapters queued on the pool at a time, topping up
+        # as they finish, rather than one future per chapter up front: the
+        # pool stays free for other work and a cancel has little to drop
+        pending = iter(chapters)
+        futures = {}
+        
+        def submit_next():
+            chapter = next(pending, None)
+            if chapter is not None:
+                futures[self._io_pool.submit(fetch, chapter)] = chapter
+        
+        for _ in range(DOWNLOAD_WORKERS * 2):
+            submit_next()
+        
+        try:
+            done = 0
+            while futures:
+                finished, _ = concurrent.futures.wait(
+                    list(futures), return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in finished:
+                    if self.cancel_requested:
+                        return False
+                    chapter = futures.pop(future)
+                    chapter.content = future.result()
+                    done += 1
+                    on_chapter_done(done, chapter)
+                    submit_next()
+        finally:
+            # Drop queued chapters on cancel/error; in-flight ones finish in background
+            for future in futures:
+                future.cancel()
+        
+        return not self.cancel_requested
     
     def _on_cancel(self):
         """Handle cancel button click."""
         self.cancel_requested = True
+        self._cancel_event.set()
+        self._cancel_translators()
         self._update_status("Cancelling...")
     
     # ------------------------------------------------------------------
@@ -741,12 +1104,17 @@ class NovelDownloaderApp(ctk.CTk):
         # Validate all URLs have parsers
         parsers = []
         for url in urls:
-            parser = get_parser_for_url(url)
+            parser = _load_parsers().get_parser_for_url(url)
             if not parser:
                 messagebox.showerror("Error", f"Unsupported site:\n{url}")
                 return
+            parser.cancel_event = self._cancel_event
             parsers.append((url, parser))
         
+        # A cancelled download leaves the event set; it must not cut this
+        # fetch's retries short (fetch is disabled while downloading)
+        self._cancel_event.clear()
+        
         # Clear old results
         self.multi_novels.clear()
         for widget in self.multi_results_frame.winfo_children():
@@ -771,9 +1139,7 @@ class NovelDownloaderApp(ctk.CTk):
         self.progress_bar.set(0)
         self._update_status("Fetching novel info...")
         
-        thread = threading.Thread(target=self._multi_fetch_thread)
-        thread.daemon = True
-        thread.start()
+        self._pool.submit(self._multi_fetch_thread)
     
     def _multi_create_result_row(self, idx: int, url: str):
         """Create a result row in the multi results panel."""
@@ -802,68 +1168,55 @@ class NovelDownloaderApp(ctk.CTk):
         })
     
     def _multi_fetch_thread(self):
-        """Fetch all novels sequentially in background."""
+        """Fetch all novels concurrently in background."""
         total = len(self.multi_novels)
+        self.after(0, lambda t=total: self._update_status(f"Fetching {t} novels..."))
         
+        # Novels are usually on different sites, so fetching them side by side
+        # costs roughly one novel's latency; the I/O pool size keeps same-site
+        # bursts small
+        futures = {}
         for idx, novel in enumerate(self.multi_novels):
-            self.after(0, lambda i=idx: self.multi_result_labels[i]['status'].configure(
-                text="Fetching...", text_color="orange"
-            ))
-            self.after(0, lambda i=idx, t=total: self.progress_bar.set((i) / t))
-            self.after(0, lambda i=idx, t=total: self._update_status(
-                f"Fetching novel {i + 1}/{t}..."
-            ))
+            futures[self._io_pool.submit(self._multi_fetch_one, novel)] = idx
+            self._queue_row(idx, 'status', text="Fetching...", text_color="orange")
+        
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            idx = futures[future]
+            try:
+                display_title, chapter_count = future.result()
+                self._queue_row(idx, 'title', text=display_title)
+                self._queue_row(idx, 'chapters', text=f"{chapter_count} ch.")
+                self._queue_row(idx, 'status', text="Ready", text_color="#2B7A3E")
+            except Exception as e:
+                self._queue_row(idx, 'status', text="Error", text_color="red")
+                self._queue_row(idx, 'title', text=f"Error: {str(e)[:50]}")
             
+            self._post_ui(('progress', done / total))
+            self._post_ui(('status', f"Fetched {done}/{total} novels..."))
+        
+        # Translate all fetched titles together (one request instead of one per novel)
+        fetched_idx = [i for i, n in enumerate(self.multi_novels) if n['status'] == 'fetched']
+        if fetched_idx:
+            self.after(0, lambda: self._update_status("Translating titles..."))
+            titles = [self.multi_novels[i]['info'].title for i in fetched_idx]
             try:
-                parser = novel['parser']
-                url = novel['url']
-                
-                if hasattr(parser, 'fetch_all_parallel'):
-                    info, chapters = parser.fetch_all_parallel(url)
-                else:
-                    info = parser.get_novel_info(url)
-                    chapters = parser.get_chapter_list(url)
-                
-                novel['info'] = info
-                novel['chapters'] = chapters
-                novel['status'] = 'fetched'
-                
-                # Translate title
-                try:
-                    translator = GoogleTranslator(max_workers=1)
-                    translated = translator.translate_text(info.title)
-                    novel['translated_title'] = translated if translated and translated != info.title else info.title
-                except Exception:
-                    novel['translated_title'] = info.title
-                
-                display_title = novel['translated_title']
+                translated = self._translate_titles(titles)
+            except Exception:
+                translated = titles
+            
+            for i, title, result in zip(fetched_idx, titles, translated):
+                self.multi_novels[i]['translated_title'] = result if result and result != title else title
+                display_title = self.multi_novels[i]['translated_title']
                 if len(display_title) > 45:
                     display_title = display_title[:42] + "..."
-                
-                self.after(0, lambda i=idx, t=display_title: self.multi_result_labels[i]['title'].configure(text=t))
-                self.after(0, lambda i=idx, c=len(chapters): self.multi_result_labels[i]['chapters'].configure(
-                    text=f"{c} ch."
-                ))
-                self.after(0, lambda i=idx: self.multi_result_labels[i]['status'].configure(
-                    text="Ready", text_color="#2B7A3E"
-                ))
-                
-            except Exception as e:
-                novel['status'] = 'error'
-                err = str(e)[:30]
-                self.after(0, lambda i=idx, msg=err: self.multi_result_labels[i]['status'].configure(
-                    text=f"Error", text_color="red"
-                ))
-                self.after(0, lambda i=idx, msg=str(e): self.multi_result_labels[i]['title'].configure(
-                    text=f"Error: {msg[:50]}"
-                ))
+                self._queue_row(i, 'title', text=display_title)
         
         # Re-enable UI
         self.after(0, lambda: self.multi_fetch_btn.configure(state="normal", text="Fetch All"))
         self.after(0, lambda: self.multi_add_btn.configure(state="normal"))
         self.after(0, lambda: self.multi_remove_btn.configure(state="normal"))
         self.after(0, lambda: self.mode_switch.configure(state="normal"))
-        self.after(0, lambda: self.progress_bar.set(1.0))
+        self._post_ui(('progress', 1.0))
         
         # Enable download if at least one novel was fetched successfully
         fetched = [n for n in self.multi_novels if n['status'] == 'fetched']
@@ -875,6 +1228,35 @@ class NovelDownloaderApp(ctk.CTk):
         else:
             self.after(0, lambda: self._update_status("No novels fetched successfully."))
     
+    def _multi_fetch_one(self, novel: dict) -> tuple:
+        """
+        Fetch one novel's info and chapter list (worker thread).
+        Only touches its own novel dict; returns (display_title, chapter_count)
+        with the untranslated title.
+        """
+        try:
+            parser = novel['parser']
+            url = novel['url']
+            
+            if hasattr(parser, 'fetch_all_parallel'):
+                info, chapters = parser.fetch_all_parallel(url)
+            else:
+                info = parser.get_novel_info(url)
+                chapters = parser.get_chapter_list(url)
+        except Exception:
+            novel['status'] = 'error'
+            raise
+        
+        novel['info'] = info
+        novel['chapters'] = chapters
+        novel['status'] = 'fetched'
+        novel['translated_title'] = info.title  # Replaced once titles are batch-translated
+        
+        display_title = info.title
+        if len(display_title) > 45:
+            display_title = display_title[:42] + "..."
+        return display_title, len(chapters)
+    
     def _on_multi_download(self):
         """Start downloading all fetched novels sequentially."""
         fetched = [n for n in self.multi_novels if n['status'] == 'fetched']
@@ -883,6 +1265,7 @@ class NovelDownloaderApp(ctk.CTk):
         
         self.is_downloading = True
         self.cancel_requested = False
+        self._cancel_event.clear()
         self.multi_download_btn.configure(state="disabled")
         self.multi_fetch_btn.configure(state="disabled")
         self.multi_add_btn.configure(state="disabled")
@@ -891,137 +1274,147 @@ class NovelDownloaderApp(ctk.CTk):
         self.fetch_btn.configure(state="disabled")
         self.mode_switch.configure(state="disabled")
         
-        thread = threading.Thread(target=self._multi_download_thread, args=(fetched,))
-        thread.daemon = True
-        thread.start()
+        self._pool.submit(self._multi_download_thread, fetched)
     
     def _multi_download_thread(self, novels: list):
-        """Download all novels sequentially in background."""
+        """
+        Download and build all novels in background.
+        
+        Chapters for the next novel download on a producer thread while the
+        current one is cleaned/translated/built here, so build time hides
+        behind the (rate-limited) downloads.
+        """
+        from core.cleaner import ContentCleaner
+        from core.epub_builder import EPUBBuilder, TranslatedEPUBBuilder
+        
         total_novels = len(novels)
         results = []  # (title, path, success, error)
         downloads_dir = self._get_downloads_folder()
+        ui_put = self._post_ui
         
-        for novel_idx, novel in enumerate(novels):
-            if self.cancel_requested:
-                results.append((novel['translated_title'] or "Unknown", "", False, "Cancelled"))
-                continue
+        # Names already taken in the output folder, listed once up front
+        # instead of stat'ing each candidate name
+        try:
+            existing = {entry.name for entry in os.scandir(downloads_dir)}
+        except OSError:
+            existing = set()
+        
+        # One cleaner/translator for the whole batch, so the translator's
+        # in-memory cache carries over between novels
+        cleaner = ContentCleaner() if self.clean_var.get() else None
+        translator = None
+        if self.translate_var.get():
+            translator = self._new_translator()
+        
+        # Downloaded novels waiting to be built; holding at most one keeps
+        # only ~2 novels' chapter text in memory at a time
+        ready: queue.Queue = queue.Queue(maxsize=1)
+        building = threading.Event()  # Set while an EPUB is being built
+        
+        def download_all():
+            """Producer: fetch chapters for each novel in order."""
+            try:
+                for novel_idx, novel in enumerate(novels):
+                    if self.cancel_requested:
+                        ready.put((novel_idx, novel, "Cancelled"))
+                        continue
+                    try:
+                        self._multi_download_chapters(novel_idx, novel, total_novels, building)
+                        ready.put((novel_idx, novel, None))
+                    except Exception as e:
+                        ready.put((novel_idx, novel, e))
+            finally:
+                ready.put(None)  # End of stream
+        
+        self._pool.submit(download_all)
+        
+        while True:
+            item = ready.get()
+            if item is None:
+                break
+            novel_idx, novel, error = item
             
             info = novel['info']
             chapters = novel['chapters']
-            parser = novel['parser']
             title_for_filename = novel['translated_title'] if novel['translated_title'] else info.title
             
+            if error == "Cancelled":
+                results.append((novel['translated_title'] or "Unknown", "", False, "Cancelled"))
+                continue
+            
             # Find the index in the full multi_novels list for UI updates
             full_idx = self.multi_novels.index(novel)
             
-            self.after(0, lambda i=full_idx: self.multi_result_labels[i]['status'].configure(
-                text="Downloading", text_color="orange"
-            ))
-            self.after(0, lambda ni=novel_idx, tn=total_novels: self._update_status(
-                f"Novel {ni + 1}/{tn}: Downloading chapters..."
-            ))
-            
             try:
+                if error is not None:
+                    raise error
+                
                 # Generate output path
                 clean_title = self._create_short_filename(title_for_filename)
-                if not clean_title:
-                    clean_title = "novel"
-                output_path = str(downloads_dir / f"{clean_title}.epub")
+                filename = f"{clean_title}.epub"
                 counter = 1
-                base_path = output_path
-                while os.path.exists(output_path):
-                    output_path = base_path.replace(".epub", f" ({counter}).epub")
+                while filename in existing:
+                    filename = f"{clean_title} ({counter}).epub"
                     counter += 1
-                
-                # Phase 1: Download chapters
-                total_ch = len(chapters)
-                delay = parser.request_delay
-                
-                for ch_idx, chapter in enumerate(chapters):
-                    if self.cancel_requested:
-                        raise Exception("Cancelled by user")
-                    
-                    overall = (novel_idx + (ch_idx + 1) / (total_ch * 2)) / total_novels
-                    self.after(0, lambda p=overall: self.progress_bar.set(p))
-                    self.after(0, lambda ni=novel_idx, tn=total_novels, ci=ch_idx, tc=total_ch: self._update_status(
-                        f"Novel {ni + 1}/{tn} — Chapter [{ci + 1}/{tc}]"
-                    ))
-                    
-                    chapter.content = parser.get_chapter_content(chapter)
-                    
-                    if ch_idx < total_ch - 1:
-                        time.sleep(delay)
+                existing.add(filename)
+                output_path = str(downloads_dir / filename)
                 
                 # Phase 2: Build EPUB
-                self.after(0, lambda ni=novel_idx, tn=total_novels: self._update_status(
-                    f"Novel {ni + 1}/{tn}: Building EPUB..."
-                ))
+                building.set()
+                self._queue_row(full_idx, 'status', text="Building", text_color="orange")
+                prefix = f"Novel {novel_idx + 1}/{total_novels}: "
+                ui_put(('status', f"{prefix}Building EPUB..."))
                 
-                cleaner = ContentCleaner() if self.clean_var.get() else None
-                translator = None
+                shown = [-1.0]  # Last progress value queued for this novel
+                
+                def progress_cb(current, total_steps, status, _ni=novel_idx, _tn=total_novels, _prefix=prefix):
+                    if translator and self.cancel_requested:
+                        translator.cancel()
+                        return
+                    overall = (_ni + 0.5 + (current / total_steps) * 0.5) / _tn
+                    ui_put(('status', _prefix + status))
+                    # Skip bar updates too small to see
+                    if overall - shown[0] >= PROGRESS_STEP or current == total_steps:
+                        shown[0] = overall
+                        ui_put(('progress', overall))
                 
-                if self.translate_var.get():
-                    try:
-                        workers = int(self.workers_entry.get())
-                    except ValueError:
-                        workers = 200
-                    translator = GoogleTranslator(max_workers=workers)
-
                 if translator:
                     builder = TranslatedEPUBBuilder(cleaner=cleaner, translator=translator)
-                    
-                    def progress_cb(current, total_steps, status, _ni=novel_idx, _tn=total_novels):
-                        if self.cancel_requested:
-                            translator.cancel()
-                            return
-                        overall = (_ni + 0.5 + (current / total_steps) * 0.5) / _tn
-                        self.after(0, lambda p=overall: self.progress_bar.set(p))
-                        self.after(0, lambda s=status, ni=_ni, tn=_tn: self._update_status(
-                            f"Novel {ni + 1}/{tn}: {s}"
-                        ))
-                    
-                    builder.build_with_translation(info, chapters, output_path, progress_cb)
+                    builder.build_with_translation(info, chapters, output_path, progress_cb, release_content=True)
                 else:
                     builder = EPUBBuilder(cleaner=cleaner)
-                    
-                    def progress_cb(current, total_steps, status, _ni=novel_idx, _tn=total_novels):
-                        overall = (_ni + 0.5 + (current / total_steps) * 0.5) / _tn
-                        self.after(0, lambda p=overall: self.progress_bar.set(p))
-                        self.after(0, lambda s=status, ni=_ni, tn=_tn: self._update_status(
-                            f"Novel {ni + 1}/{tn}: {s}"
-                        ))
-                    
-                    builder.build(info, chapters, output_path, progress_cb)
+                    builder.build(info, chapters, output_path, progress_cb, release_content=True)
                 
                 results.append((title_for_filename, output_path, True, None))
-                self.after(0, lambda i=full_idx: self.multi_result_labels[i]['status'].configure(
-                    text="Done", text_color="#2B7A3E"
-                ))
+                self._queue_row(full_idx, 'status', text="Done", text_color="#2B7A3E")
                 
             except Exception as e:
                 results.append((title_for_filename, "", False, str(e)))
-                self.after(0, lambda i=full_idx: self.multi_result_labels[i]['status'].configure(
-                    text="Failed", text_color="red"
-                ))
+                self._queue_row(full_idx, 'status', text="Failed", text_color="red")
+            finally:
+                building.clear()
+        
+        if translator:
+            translator.close()
         
         # All done - show summary
-        self.after(0, lambda: self.progress_bar.set(1.0))
+        ui_put(('progress', 1.0))
         
         success = [r for r in results if r[2]]
         failed = [r for r in results if not r[2]]
         
-        summary = f"Completed: {len(success)}/{len(results)} novels\n\n"
+        lines = [f"Completed: {len(success)}/{len(results)} novels", ""]
         if success:
-            summary += "Saved to:\n"
-            for title, path, _, _ in success:
-                summary += f"  • {Path(path).name}\n"
+            lines.append("Saved to:")
+            lines.extend(f"  • {Path(path).name}" for _, path, _, _ in success)
         if failed:
-            summary += "\nFailed:\n"
+            lines.extend(["", "Failed:"])
             for title, _, _, err in failed:
                 short_title = title[:30] + "..." if len(title) > 30 else title
-                summary += f"  • {short_title}: {err[:40]}\n"
+                lines.append(f"  • {short_title}: {err[:40]}")
         
-        summary += f"\nLocation: {downloads_dir}"
+        lines.extend(["", f"Location: {downloads_dir}"])
+        summary = "\n".join(lines)
         
         self.after(0, lambda s=summary: self._update_status(
             f"Done! {len(success)}/{len(results)} novels downloaded."
@@ -1038,18 +1431,74 @@ class NovelDownloaderApp(ctk.CTk):
         self.after(0, lambda: self.fetch_btn.configure(state="normal"))
         self.after(0, lambda: self.mode_switch.configure(state="normal"))
     
+    def _multi_download_chapters(self, novel_idx: int, novel: dict, total_novels: int, building: threading.Event):
+        """Download one novel's chapters (producer side of multi download)."""
+        chapters = novel['chapters']
+        total_ch = len(chapters)
+        full_idx = self.multi_novels.index(novel)
+        ui_put = self._post_ui
+        
+        self._queue_row(full_idx, 'status', text="Downloading", text_color="orange")
+        
+        # Per-novel parts of the progress value and status text, computed once
+        prefix = f"Novel {novel_idx + 1}/{total_novels} — Chapter ["
+        suffix = f"/{total_ch}]"
+        base = novel_idx / total_novels
+        step = 1 / (total_ch * 2 * total_novels)  # Download is the first half
+        
+        def on_chapter_done(done, chapter):
+            self._queue_row(full_idx, 'status', text=f"{done}{suffix}")
+            # The overall bar/status belong to the builder while it is busy
+            if not building.is_set():
+                ui_put(('progress', base + done * step))
+                ui_put(('status', f"{prefix}{done}{suffix}"))
+        
+        if not self._download_chapters(novel['parser'], chapters, on_chapter_done):
+            raise Exception("Cancelled by user")
+    
     def _load_cover(self, url: str):
         """Load cover image from URL in background."""
+        from PIL import Image
+        
         try:
-            print(f"Loading cover from: {url}")
-            response = http_session.get(url, timeout=15)
-            response.raise_for_status()
+            # Covers are cached on disk so re-fetching a novel skips the download
+            cache_file = self.cache_dir / "covers" / hashlib.blake2b(
+                url.encode("utf-8"), digest_size=16
+            ).hexdigest()
             
-            # Load image with PIL
-            image = Image.open(BytesIO(response.content))
+            if cache_file.exists():
+                print(f"Loading cover from cache: {url}")
+            else:
+                print(f"Loading cover from: {url}")
+                self._download_cover(url, cache_file)
             
-            # Resize to fit (100x140 max, keep aspect ratio)
-            image.thumbnail((100, 140), Image.Resampling.LANCZOS)
+            # Load image with PIL straight from the file; draft() lets the
+            # JPEG decoder downscale while decoding (IDCT scaling by 1/2, 1/4
+            # or 1/8, never below the target) instead of building the
+            # full-size image. It is a no-op for other formats.
+            from_cache = cache_file.exists()
+            image = None
+            try:
+                if from_cache:
+                    image = Image.open(cache_file)
+                else:
+                    image = Image.open(BytesIO(get_session().get(url, timeout=15).content))
+                image.draft("RGB", (100, 140))
+                
+                # Resize to fit (100x140 max, keep aspect ratio). BILINEAR is
+                # indistinguishable from LANCZOS at thumbnail size and cheaper.
+                image.thumbnail((100, 140), Image.Resampling.BILINEAR)
+            except Exception:
+                # A cached file PIL can't decode would fail on every later
+                # fetch; drop it so the next one downloads again
+                if image is not None:
+                    image.close()
+                if from_cache:
+                    try:
+                        cache_file.unlink()
+                    except OSError:
+                        pass
+                raise
             
             # Convert to CTkImage
             ctk_image = ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
@@ -1061,38 +1510,150 @@ class NovelDownloaderApp(ctk.CTk):
         except Exception as e:
             print(f"Failed to load cover: {e}")
     
+    def _download_cover(self, url: str, cache_file: Path):
+        """
+        Stream a cover image to the disk cache in chunks. Raises ValueError
+        (caching nothing) if the body isn't an image or is cut short, e.g.
+        a hotlink-protection HTML page served with status 200.
+        """
+        from core.epub_builder import sniff_image_type
+        
+        response = get_session().get(url, timeout=15, stream=True)
+        try:
+            response.raise_for_status()
+            expected = int(response.headers.get("Content-Length") or 0)
+            part_file = cache_file.with_suffix(".part")
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                head = b""
+                received = 0
+                with open(part_file, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        if len(head) < 16:
+                            head += chunk[:16]
+                        received += len(chunk)
+                        f.write(chunk)
+                
+                if sniff_image_type(head) is None:
+                    part_file.unlink(missing_ok=True)
+                    raise ValueError("cover URL did not return an image")
+                if expected and received < expected:
+                    part_file.unlink(missing_ok=True)
+                    raise ValueError(f"cover download truncated ({received}/{expected} bytes)")
+                part_file.replace(cache_file)
+            except OSError as e:
+                # Caller falls back to an in-memory download
+                print(f"Could not cache cover: {e}")
+                part_file.unlink(missing_ok=True)
+        finally:
+            response.close()
+    
     def _set_cover_image(self, image):
         """Set the cover image in the UI."""
         self.cover_image = image  # Keep reference
         self.cover_label.configure(image=image, text="")
     
+    def _translate_title_text(self, title: str) -> str:
+        """Translate a novel title, memoized for the session (thread-safe)."""
+        return self._translate_titles([title])[0]
+    
+    def _translate_titles(self, titles: List[str]) -> List[str]:
+        """Translate several titles in one request, reusing memoized results."""
+        with self._title_lock:
+            missing = list(dict.fromkeys(t for t in titles if t not in self._title_translations))
+            if missing:
+                if self._title_translator is None:
+                    from core.translator import GoogleTranslator
+                    # Handing it the shared pooled session keeps titles on the
+                    # sync path: one request on a warm connection, instead of
+                    # a new AsyncSession (TLS handshake) and event loop per call
+                    self._title_translator = GoogleTranslator(
+                        max_workers=1, persistent_cache=self.translation_cache,
+                        session=get_session()
+                    )
+                for title, translated in zip(missing, self._title_translator.translate_batch(missing)):
+                    # Only remember real translations so a failed attempt is retried
+                    if translated and translated != title:
+                        self._title_translations[title] = translated
+            return [self._title_translations.get(t, t) for t in titles]
+    
     def _translate_title(self, title: str):
         """Translate the title to English in background."""
         try:
             print(f"Translating title: {title}")
-            translator = GoogleTranslator(max_workers=1)
-            translated = translator.translate_text(title)
+            translated = self._translate_title_text(title)
             
             if translated and translated != title:
                 self.translated_title = translated
-                self.after(0, lambda t=translated: self.eng_title_label.configure(text=t, text_color="white"))
+                self.after(0, lambda t=translated: self._queue_info(self.eng_title_label, text=t, text_color="white"))
                 print(f"Translated title: {translated}")
             else:
                 self.translated_title = title
-                self.after(0, lambda: self.eng_title_label.configure(text="(same as original)", text_color="gray"))
+                self.after(0, lambda: self._queue_info(self.eng_title_label, text="(same as original)", text_color="gray"))
                 
         except Exception as e:
             print(f"Failed to translate title: {e}")
             self.translated_title = title
-            self.after(0, lambda: self.eng_title_label.configure(text="(translation failed)", text_color="gray"))
+            self.after(0, lambda: self._queue_info(self.eng_title_label, text="(translation failed)", text_color="gray"))
+    
+    def _post_ui(self, item: tuple):
+        """Queue a (kind, value) UI update from any thread; schedules one drain if none is pending."""
+        self._ui_queue.put(item)
+        with self._ui_lock:
+            if self._ui_drain_scheduled:
+                return
+            self._ui_drain_scheduled = True
+        try:
+            self.after(UI_REFRESH_MS, self._drain_ui_queue)
+        except (RuntimeError, tk.TclError):
+            pass  # Window already closed; nothing left to update
+    
+    def _drain_ui_queue(self):
+        """Apply queued worker updates (scheduled by _post_ui)."""
+        # Clear the flag first: anything posted from here on schedules a
+        # new drain, anything posted before is picked up by this flush
+        with self._ui_lock:
+            self._ui_drain_scheduled = False
+        self._flush_ui_queue()
+    
+    def _flush_ui_queue(self):
+        """Apply pending progress/status updates, keeping only the latest of each."""
+        progress = status = None
+        rows = {}  # (row index, column) -> merged configure() options
+        while True:
+            try:
+                kind, value = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                progress = value
+            elif kind == 'status':
+                status = value
+            elif kind == 'row':
+                idx, column, options = value
+                rows.setdefault((idx, column), {}).update(options)
+        
+        if progress is not None:
+            self.progress_bar.set(progress)
+        if status is not None:
+            self.status_label.configure(text=status)
+        for (idx, column), options in rows.items():
+            if idx < len(self.multi_result_labels):
+                self.multi_result_labels[idx][column].configure(**options)
+    
+    def _queue_row(self, idx: int, column: str, **options):
+        """Queue a multi-mode result row update (thread-safe)."""
+        self._post_ui(('row', (idx, column, options)))
     
     def _update_status(self, text: str):
         """Update status label."""
+        # Apply queued worker updates first so they can't overwrite this later
+        self._flush_ui_queue()
         self.status_label.configure(text=text)
     
     def _show_error(self, message: str):
         """Show error message."""
-        self.status_label.configure(text="Error")
+        self._update_status("Error")
         messagebox.showerror("Error", message)
     
     def _on_auto_update_toggle(self):
@@ -1105,7 +1666,7 @@ class NovelDownloaderApp(ctk.CTk):
             if has_update:
                 self.after(0, lambda: self._show_update_available(latest_version, message))
         
-        check_for_updates_async(callback)
+        check_for_updates_async(callback, max_age=RELEASE_CACHE_MAX_AGE)
     
     def _on_check_updates(self):
         """Handle manual check for updates button click."""
@@ -1160,8 +1721,11 @@ class NovelDownloaderApp(ctk.CTk):
         status_label.pack(pady=5)
         
         def progress_callback(current, total, status):
-            self.after(0, lambda: progress_bar.set(current / total))
-            self.after(0, lambda s=status: status_label.configure(text=s))
+            # One Tk callback per update for both widgets
+            def apply(fraction=current / total, text=status):
+                progress_bar.set(fraction)
+                status_label.configure(text=text)
+            self.after(0, apply)
         
         def completion_callback(success, message):
             self.after(0, progress_window.destroy)
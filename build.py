@@ -9,8 +9,14 @@ import subprocess
 import shutil
 from pathlib import Path
 
-def build():
-    """Build the application using PyInstaller."""
+def build(onedir: bool = False):
+    """
+    Build the application using PyInstaller.
+    
+    onedir=True builds a folder instead of a single file. It starts faster
+    (a --onefile exe unpacks itself to a temp dir on every launch) but the
+    built-in updater only knows how to replace the single-file exe.
+    """
     
     # Get the directory of this script
     script_dir = Path(__file__).parent.absolute()
@@ -41,7 +47,7 @@ def build():
     args = [
         'pyinstaller',
         '--name=NovelDownloader',
-        '--onefile',                    # Single executable
+        '--onedir' if onedir else '--onefile',  # Folder or single executable
         '--windowed',                   # No console window
         '--noconfirm',                  # Overwrite without asking
         f'--distpath={script_dir / "dist"}',
@@ -53,14 +59,21 @@ def build():
         '--hidden-import=lxml',
         '--hidden-import=lxml.html',
         '--hidden-import=lxml.etree',
-        '--hidden-import=bs4',
         '--hidden-import=ebooklib',
         '--hidden-import=ebooklib.epub',
         '--hidden-import=PIL',
         '--hidden-import=customtkinter',
         
-        # Collect all customtkinter data
-        '--collect-all=customtkinter',
+        # customtkinter's themes/fonts (its modules are found by normal imports)
+        '--collect-data=customtkinter',
+        
+        # Unused stdlib/library modules; fewer .pyc files to bundle and load.
+        # PIL.ImageTk must stay - CTkImage draws through it.
+        '--exclude-module=test',
+        '--exclude-module=tkinter.test',
+        '--exclude-module=pydoc_data',
+        '--exclude-module=PIL.ImageQt',
+        '--exclude-module=lxml.isoschematron',
         
         # Add core and parsers as data (in case of import issues)
         f'--add-data={script_dir / "core"}{separator}core',
@@ -79,6 +92,8 @@ def build():
     
     if result.returncode == 0:
         exe_path = script_dir / "dist" / exe_name
+        if onedir:
+            exe_path = script_dir / "dist" / "NovelDownloader" / exe_name
         if exe_path.exists():
             size_mb = exe_path.stat().st_size / (1024 * 1024)
             print()
@@ -94,4 +109,4 @@ def build():
         sys.exit(1)
 
 if __name__ == "__main__":
-    build()
+    build(onedir='--onedir' in sys.argv[1:])
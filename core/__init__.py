@@ -1,17 +1,43 @@
 # Author: joelsnl and Anthropic Claude
 """
 Core modules for Novel Downloader
+
+Names are re-exported lazily (PEP 562): importing a light submodule such
+as core.http or core.updater doesn't pull in lxml/ebooklib through
+this package's __init__.
 """
 
-from core.parser import BaseParser, Chapter, NovelInfo, get_parser_for_url, get_supported_sites, cleanup_browser
-from core.cleaner import ContentCleaner, is_chinese, count_chinese_chars
-from core.translator import GoogleTranslator
-from core.epub_builder import EPUBBuilder, TranslatedEPUBBuilder
-
-__all__ = [
-    'BaseParser', 'Chapter', 'NovelInfo',
-    'get_parser_for_url', 'get_supported_sites', 'cleanup_browser',
-    'ContentCleaner', 'is_chinese', 'count_chinese_chars',
-    'GoogleTranslator',
-    'EPUBBuilder', 'TranslatedEPUBBuilder',
-]
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'BaseParser': 'core.parser',
+    'Chapter': 'core.parser',
+    'NovelInfo': 'core.parser',
+    'RateLimiter': 'core.parser',
+    'get_parser_for_url': 'core.parser',
+    'get_supported_sites': 'core.parser',
+    'cleanup_browser': 'core.parser',
+    'ContentCleaner': 'core.cleaner',
+    'is_chinese': 'core.cleaner',
+    'count_chinese_chars': 'core.cleaner',
+    'GoogleTranslator': 'core.translator',
+    'TranslationCache': 'core.translation_cache',
+    'EPUBBuilder': 'core.epub_builder',
+    'TranslatedEPUBBuilder': 'core.epub_builder',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'core' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -20,6 +20,7 @@ Features:
 """
 
 import re
+import threading
 from typing import List, Optional, Set, Dict
 from lxml import etree
 from lxml import html as lxml_html
@@ -50,6 +51,9 @@ REMOVE_ELEMENTS = {'script', 'embed', 'object', 'form', 'input', 'button', 'text
 # Invisible characters to remove
 INVISIBLE_CHARS = '\u200b\u200c\u200d\ufeff\u00ad\u2060\u180e\u200e\u200f\u202a\u202b\u202c\u202d\u202e'
 
+# str.translate table: drop invisible chars, non-breaking hyphen -> '-'
+_TEXT_TABLE = {**dict.fromkeys(map(ord, INVISIBLE_CHARS)), 0x2011: '-'}
+
 # Ad div classes to remove
 REMOVE_DIV_CLASSES = {'txtad', 'ad', 'advertisement', 'ads', 'adsbygoogle'}
 
@@ -62,6 +66,19 @@ DEPRECATED_TAG_CONVERSIONS = [
     ('font', 'span', {}),
 ]
 
+# lxml parsers must not be used by two threads at once, so each thread
+# builds its recovering XML parser once and reuses it for every chapter
+_xml_parsers = threading.local()
+
+
+def _xml_parser() -> etree.XMLParser:
+    """This thread's recovering XML parser (created on first use)."""
+    parser = getattr(_xml_parsers, 'parser', None)
+    if parser is None:
+        parser = _xml_parsers.parser = etree.XMLParser(recover=True, no_network=True)
+    return parser
+
+
 # Default watermark patterns
 DEFAULT_WATERMARKS = [
     # Standard Chinese watermarks
@@ -100,6 +117,19 @@ DEFAULT_WATERMARKS = [
     r'→\s*[\U0001D400-\U0001D7FFａ-ｚＡ-Ｚ０-９]+\.[\U0001D400-\U0001D7FFａ-ｚＡ-Ｚ]+',
 ]
 
+# Compiled once at import; each ContentCleaner only compiles its custom patterns
+_DEFAULT_WATERMARK_RES = tuple(re.compile(p, re.IGNORECASE) for p in DEFAULT_WATERMARKS)
+
+# parse_xhtml: encoding declarations that would conflict with re-encoding
+_XML_DECL_RE = re.compile(r'<\?xml[^>]*\?>')
+_ENCODING_ATTR_RE = re.compile(r'encoding\s*=\s*["\'][^"\']*["\']')
+
+# serialize_xhtml: self-closed tags that e-readers want written out in full
+_SELF_CLOSING_RE = re.compile(
+    r'<({})(\s[^>]*)?\s*/>'.format('|'.join(SELF_CLOSING_BAD_TAGS)).encode('utf-8'),
+    re.IGNORECASE
+)
+
 
 class ContentCleaner:
     """
@@ -111,10 +141,9 @@ class ContentCleaner:
     
     def __init__(self, custom_watermarks: List[str] = None, convert_br_to_p: bool = True):
         self.convert_br_to_p = convert_br_to_p
-        self.watermark_patterns = []
+        self.watermark_patterns = list(_DEFAULT_WATERMARK_RES)
         
-        all_patterns = DEFAULT_WATERMARKS + (custom_watermarks or [])
-        for pattern in all_patterns:
+        for pattern in custom_watermarks or []:
             try:
                 self.watermark_patterns.append(re.compile(pattern, re.IGNORECASE))
             except re.error:
@@ -145,12 +174,9 @@ class ContentCleaner:
         
         original = text
         
-        # Remove invisible characters
-        for char in INVISIBLE_CHARS:
-            text = text.replace(char, '')
-        
-        # Replace non-breaking hyphen
-        text = text.replace('\u2011', '-')
+        # Remove invisible characters and replace non-breaking hyphens,
+        # in one pass
+        text = text.translate(_TEXT_TABLE)
         
         # Remove watermarks
         for pattern in self.watermark_patterns:
@@ -192,13 +218,12 @@ class ContentCleaner:
         text = text.replace('\0', '')
         
         # Strip encoding declarations that might conflict
-        text = re.sub(r'<\?xml[^>]*\?>', '', text)
-        text = re.sub(r'encoding\s*=\s*["\'][^"\']*["\']', '', text)
+        text = _XML_DECL_RE.sub('', text)
+        text = _ENCODING_ATTR_RE.sub('', text)
         
         try:
             # Try parsing as XML first (preserves XHTML namespace)
-            parser = etree.XMLParser(recover=True, no_network=True)
-            root = etree.fromstring(text.encode('utf-8'), parser)
+            root = etree.fromstring(text.encode('utf-8'), _xml_parser())
         except Exception:
             try:
                 # Fall back to HTML parser
@@ -411,18 +436,13 @@ class ContentCleaner:
     
     def _fix_self_closing_tags(self, data: bytes) -> bytes:
         """Convert self-closing tags to properly closed tags for e-reader compatibility."""
-        pattern_str = r'<({})(\s[^>]*)?\s*/>'.format('|'.join(SELF_CLOSING_BAD_TAGS))
-        pattern = re.compile(pattern_str.encode('utf-8'), re.IGNORECASE)
-        
         def replace_func(match):
             tag = match.group(1)
             attrs = match.group(2) or b''
             return b'<' + tag + attrs + b'></' + tag + b'>'
         
-        fixed = pattern.findall(data)
-        self.stats['self_closing_fixed'] += len(fixed)
-        
-        result = pattern.sub(replace_func, data)
+        result, fixed = _SELF_CLOSING_RE.subn(replace_func, data)
+        self.stats['self_closing_fixed'] += fixed
         return result
     
     # ========================================================================
@@ -461,22 +481,27 @@ class ContentCleaner:
         """
         try:
             root = lxml_html.fromstring(html_content)
-            root = self._clean_html_content(root)
+            root = self.clean_tree(root)
             return lxml_html.tostring(root, encoding='unicode')
         except Exception:
             return self.clean_text(html_content)
     
+    def clean_tree(self, root) -> etree._Element:
+        """Clean an already-parsed lxml HTML tree in place (see clean_html)."""
+        return self._clean_html_content(root)
+    
     def _clean_html_content(self, root) -> etree._Element:
         """Clean HTML content (non-XHTML namespace path)."""
         
-        # Remove forbidden elements
+        # Remove forbidden elements (iter() is snapshotted: removing the
+        # current element would otherwise end the walk early)
         for tag in REMOVE_ELEMENTS:
-            for elem in root.iter(tag):
+            for elem in list(root.iter(tag)):
                 self._remove_element_keep_tail(elem)
                 self.stats['elements_removed'] += 1
         
         # Remove empty ad divs
-        for elem in root.iter('div'):
+        for elem in list(root.iter('div')):
             class_attr = elem.get('class', '')
             classes = set(class_attr.lower().split())
             if classes & REMOVE_DIV_CLASSES:
@@ -506,7 +531,7 @@ class ContentCleaner:
         
         # Remove empty inline tags
         for tag in ['a', 'i', 'b', 'u', 'span', 'em', 'strong']:
-            for elem in root.iter(tag):
+            for elem in list(root.iter(tag)):
                 if (elem.get('id') is None and elem.get('name') is None and
                     len(elem) == 0 and not (elem.text and elem.text.strip())):
                     self._remove_element_keep_tail(elem)
@@ -548,10 +573,10 @@ class ContentCleaner:
         if parent is None:
             return
         
-        idx = list(parent).index(elem)
+        # getprevious() is O(1); looking up the index was O(siblings)
+        prev = elem.getprevious()
         if elem.tail:
-            if idx > 0:
-                prev = parent[idx - 1]
+            if prev is not None:
                 prev.tail = (prev.tail or '') + elem.tail
             else:
                 parent.text = (parent.text or '') + elem.tail
@@ -566,15 +591,25 @@ class ContentCleaner:
 # MODULE-LEVEL UTILITIES
 # ============================================================================
 
+# CJK Unified Ideographs + Extension A
+_CJK_RE = re.compile(r'[\u4e00-\u9fff\u3400-\u4dbf]')
+
+# Runs of the same characters, for counting: one match per run instead
+# of one per character (about half the work on CJK-heavy chapters)
+_CJK_RUN_RE = re.compile(r'[\u4e00-\u9fff\u3400-\u4dbf]+')
+
+
 def is_chinese(text: str) -> bool:
     """Check if text contains Chinese characters."""
-    if not text:
+    # str.isascii() is a C scan (O(1) for ASCII-only strings), much
+    # cheaper than the regex for already-English text
+    if not text or text.isascii():
         return False
-    return bool(re.search(r'[\u4e00-\u9fff\u3400-\u4dbf]', text))
+    return _CJK_RE.search(text) is not None
 
 
 def count_chinese_chars(text: str) -> int:
     """Count Chinese characters in text."""
-    if not text:
+    if not text or text.isascii():
         return 0
-    return len(re.findall(r'[\u4e00-\u9fff\u3400-\u4dbf]', text))
+    return sum(map(len, _CJK_RUN_RE.findall(text)))
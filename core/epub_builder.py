@@ -12,27 +12,141 @@ New features ported from fixTranslate.py:
 
 import os
 import io
-import re
-from typing import List, Optional, Callable, Tuple
+import html
+import hashlib
+import zipfile
+import threading
+import concurrent.futures
+from typing import Dict, List, Optional, Callable, Tuple
 from pathlib import Path
 
 from ebooklib import epub
+from lxml import etree, html as lxml_html
 
 from core.parser import Chapter, NovelInfo
 from core.cleaner import ContentCleaner, is_chinese, count_chinese_chars
+from core.http import get_session
 
-# Use curl_cffi for better compatibility (same as parser)
+# Deflate level for EPUB contents. Level 1 is several times faster than
+# zipfile's default (6) and only slightly larger for text.
+EPUB_COMPRESSLEVEL = 1
+
+# ISA-L's SIMD deflate is ~3x faster than zlib at low levels (optional)
 try:
-    from curl_cffi.requests import Session as HttpSession
-    _http_session = HttpSession(impersonate="chrome120")
-    print("EPUB Builder: Using curl_cffi for image downloads")
+    from isal import isal_zlib
 except ImportError:
-    import requests
-    _http_session = requests.Session()
-    _http_session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0'
-    })
-    print("EPUB Builder: Using requests for image downloads")
+    isal_zlib = None
+
+# Serializes the zipfile compressor swap in _FastEpubWriter.write()
+_compressor_lock = threading.Lock()
+
+# Images larger than this are not downloaded (bad URL, not a cover)
+MAX_IMAGE_BYTES = 10 << 20
+# PNG covers above this are re-encoded as JPEG; photos stored as PNG
+# barely deflate and bloat the EPUB
+RECOMPRESS_PNG_BYTES = 2 << 20
+
+# Segments collected while cleaning before they're handed to the
+# translator's background prefetch
+PREFETCH_SEGMENTS = 200
+
+# Stylesheet for every EPUB, encoded once
+_DEFAULT_CSS = '''
+body {
+    font-family: Georgia, "Times New Roman", serif;
+    font-size: 1em;
+    line-height: 1.6;
+    margin: 1em;
+    padding: 0;
+}
+
+h1 {
+    font-size: 1.5em;
+    margin-bottom: 1em;
+    text-align: center;
+}
+
+h2 {
+    font-size: 1.3em;
+    margin-top: 1.5em;
+    margin-bottom: 0.5em;
+}
+
+p {
+    margin: 0.5em 0;
+    text-indent: 2em;
+}
+
+.chapter-title {
+    text-align: center;
+    font-weight: bold;
+    margin-bottom: 1em;
+}
+'''
+_DEFAULT_CSS_BYTES = _DEFAULT_CSS.encode('utf-8')
+
+# Magic-byte prefixes -> file extension
+_IMAGE_SIGNATURES = (
+    (b'\x89PNG', 'png'),
+    (b'GIF8', 'gif'),
+    (b'\xff\xd8\xff', 'jpg'),
+)
+
+
+def sniff_image_type(data: bytes) -> Optional[str]:
+    """Return the image extension (png/gif/jpg/webp) from its first bytes."""
+    for signature, ext in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return ext
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+# Already-compressed formats, stored as-is instead of deflated again
+_STORED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+
+class _FastEpubWriter(epub.EpubWriter):
+    """
+    EpubWriter that deflates items at EPUB_COMPRESSLEVEL (with ISA-L if
+    installed) and stores images uncompressed.
+    """
+    
+    def _write_items(self):
+        self.out.compresslevel = EPUB_COMPRESSLEVEL
+        writestr = self.out.writestr
+        
+        def writestr_by_type(name, data, compress_type=None, compresslevel=None):
+            if compress_type is None and isinstance(name, str) and name.lower().endswith(_STORED_EXTENSIONS):
+                compress_type = zipfile.ZIP_STORED
+            return writestr(name, data, compress_type, compresslevel)
+        
+        self.out.writestr = writestr_by_type
+        try:
+            super()._write_items()
+        finally:
+            del self.out.writestr
+    
+    def write(self):
+        if isal_zlib is None:
+            return super().write()
+        
+        # zipfile has no hook for the compressor, so swap its factory for the
+        # duration of the write. Output is standard deflate either way.
+        with _compressor_lock:
+            original = zipfile._get_compressor
+            
+            def get_compressor(compress_type, compresslevel=None):
+                if compress_type == zipfile.ZIP_DEFLATED and compresslevel == EPUB_COMPRESSLEVEL:
+                    return isal_zlib.compressobj(compresslevel, isal_zlib.DEFLATED, -15)
+                return original(compress_type, compresslevel)
+            
+            zipfile._get_compressor = get_compressor
+            try:
+                return super().write()
+            finally:
+                zipfile._get_compressor = original
 
 
 class EPUBBuilder:
@@ -46,7 +160,9 @@ class EPUBBuilder:
         novel_info: NovelInfo,
         chapters: List[Chapter],
         output_path: str,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        release_content: bool = False,
+        clean: bool = True
     ) -> str:
         """
         Build an EPUB file from chapters.
@@ -56,6 +172,10 @@ class EPUBBuilder:
             chapters: List of chapters with content loaded
             output_path: Where to save the EPUB
             progress_callback: Optional callback(current, total, status)
+            release_content: Clear each chapter's content once it has been
+                converted, so only one copy of the book is held in memory
+            clean: Run the cleaner on each chapter (False if the caller
+                already has)
             
         Returns:
             Path to the created EPUB file
@@ -72,7 +192,13 @@ class EPUBBuilder:
         book = epub.EpubBook()
         
         # Set metadata
-        book.set_identifier(f"novel-{hash(novel_info.title)}")
+        # Stable across runs (hash() is salted per process) so readers see a
+        # re-download as the same book; keyed on the source URL when known,
+        # since the title may translate differently each time
+        ident_source = novel_info.source_url or novel_info.title
+        book.set_identifier(
+            "novel-" + hashlib.blake2b(ident_source.encode('utf-8'), digest_size=8).hexdigest()
+        )
         book.set_title(novel_info.title)
         book.set_language('en')  # Set to English since we're translating
         book.add_author(novel_info.author)
@@ -93,12 +219,21 @@ class EPUBBuilder:
                 cover_data = self._download_image(novel_info.cover_url)
                 if cover_data:
                     print(f"  Cover downloaded: {len(cover_data)} bytes")
-                    # Determine image type
-                    ext = 'jpg'
-                    if novel_info.cover_url.lower().endswith('.png'):
-                        ext = 'png'
-                    elif novel_info.cover_url.lower().endswith('.gif'):
-                        ext = 'gif'
+                    # Determine image type from the data (URLs often lie or
+                    # have no extension), falling back to the URL suffix
+                    ext = sniff_image_type(cover_data)
+                    if ext is None:
+                        ext = 'jpg'
+                        if novel_info.cover_url.lower().endswith('.png'):
+                            ext = 'png'
+                        elif novel_info.cover_url.lower().endswith('.gif'):
+                            ext = 'gif'
+                    
+                    if ext == 'png' and len(cover_data) > RECOMPRESS_PNG_BYTES:
+                        jpeg_data = self._png_to_jpeg(cover_data)
+                        if jpeg_data:
+                            print(f"  Re-encoded PNG cover as JPEG: {len(jpeg_data)} bytes")
+                            cover_data, ext = jpeg_data, 'jpg'
                     
                     book.set_cover(f"cover.{ext}", cover_data)
                     print(f"  Cover added to EPUB as cover.{ext}")
@@ -118,7 +253,7 @@ class EPUBBuilder:
             
             # Clean content
             content = chapter.content
-            if self.cleaner:
+            if self.cleaner and clean:
                 content = self.cleaner.clean_html(content)
             
             # Validate content isn't empty after cleaning
@@ -137,6 +272,8 @@ class EPUBBuilder:
             # Wrap content in proper XHTML
             xhtml_content = self._wrap_xhtml(chapter.title, content)
             epub_chapter.content = xhtml_content.encode('utf-8')
+            if release_content:
+                chapter.content = ""
             
             book.add_item(epub_chapter)
             epub_chapters.append(epub_chapter)
@@ -155,12 +292,11 @@ class EPUBBuilder:
         book.add_item(epub.EpubNav())
         
         # Add CSS
-        css = self._get_default_css()
         nav_css = epub.EpubItem(
             uid="style_nav",
             file_name="style/nav.css",
             media_type="text/css",
-            content=css.encode('utf-8')
+            content=_DEFAULT_CSS_BYTES
         )
         book.add_item(nav_css)
         
@@ -170,7 +306,9 @@ class EPUBBuilder:
         
         print(f"Writing EPUB to: {output_path}")
         try:
-            epub.write_epub(output_path, book, {})
+            writer = _FastEpubWriter(output_path, book, {})
+            writer.process()
+            writer.write()
             file_size = os.path.getsize(output_path)
             print(f"EPUB written successfully: {file_size} bytes ({file_size/1024:.1f} KB)")
         except Exception as e:
@@ -180,19 +318,41 @@ class EPUBBuilder:
         return output_path
     
     def _download_image(self, url: str) -> Optional[bytes]:
-        """Download an image and return bytes using curl_cffi."""
+        """Download an image (streamed, up to MAX_IMAGE_BYTES) using the shared session."""
         try:
-            response = _http_session.get(url, timeout=30)
-            response.raise_for_status()
-            return response.content
+            response = get_session().get(url, timeout=30, stream=True)
+            try:
+                response.raise_for_status()
+                data = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    data += chunk
+                    if len(data) > MAX_IMAGE_BYTES:
+                        print(f"  Image larger than {MAX_IMAGE_BYTES >> 20} MB, skipped")
+                        return None
+                return bytes(data)
+            finally:
+                response.close()
         except Exception as e:
             print(f"  Image download error: {e}")
             return None
     
+    @staticmethod
+    def _png_to_jpeg(data: bytes) -> Optional[bytes]:
+        """Re-encode PNG bytes as JPEG (quality 85), or None without Pillow."""
+        try:
+            from PIL import Image
+            
+            out = io.BytesIO()
+            Image.open(io.BytesIO(data)).convert('RGB').save(out, 'JPEG', quality=85, optimize=True)
+            return out.getvalue()
+        except Exception as e:
+            print(f"  Could not re-encode cover: {e}")
+            return None
+    
     def _wrap_xhtml(self, title: str, content: str) -> str:
         """Wrap content in proper XHTML structure."""
-        # Escape title for XML
-        title = title.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        title = html.escape(title, quote=False)
+        content = self._to_xml_fragment(content)
         
         return f'''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE html>
@@ -207,40 +367,20 @@ class EPUBBuilder:
 </body>
 </html>'''
     
-    def _get_default_css(self) -> str:
-        """Get default CSS for the EPUB."""
-        return '''
-body {
-    font-family: Georgia, "Times New Roman", serif;
-    font-size: 1em;
-    line-height: 1.6;
-    margin: 1em;
-    padding: 0;
-}
-
-h1 {
-    font-size: 1.5em;
-    margin-bottom: 1em;
-    text-align: center;
-}
-
-h2 {
-    font-size: 1.3em;
-    margin-top: 1.5em;
-    margin-bottom: 0.5em;
-}
-
-p {
-    margin: 0.5em 0;
-    text-indent: 2em;
-}
-
-.chapter-title {
-    text-align: center;
-    font-weight: bold;
-    margin-bottom: 1em;
-}
-'''
+    @staticmethod
+    def _to_xml_fragment(content: str) -> str:
+        """
+        Re-serialize chapter HTML as XML so stray '&' or unclosed tags
+        can't make the XHTML file unreadable.
+        """
+        try:
+            root = lxml_html.fragment_fromstring(content, create_parent='div')
+        except Exception:
+            return content
+        xml = etree.tostring(root, method='xml', encoding='unicode')
+        if xml.endswith('/>'):
+            return ''  # empty <div/>
+        return xml[len('<div>'):-len('</div>')]
 
 
 class TranslatedEPUBBuilder(EPUBBuilder):
@@ -273,7 +413,8 @@ class TranslatedEPUBBuilder(EPUBBuilder):
         novel_info: NovelInfo,
         chapters: List[Chapter],
         output_path: str,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        release_content: bool = False
     ) -> str:
         """
         Build EPUB with translation.
@@ -282,7 +423,7 @@ class TranslatedEPUBBuilder(EPUBBuilder):
         """
         if not self.translator:
             # No translator, just build normally
-            return self.build(novel_info, chapters, output_path, progress_callback)
+            return self.build(novel_info, chapters, output_path, progress_callback, release_content)
         
         self.chapters_with_chinese = []
         total_steps = len(chapters) * 2  # Clean + Translate phases
@@ -313,21 +454,41 @@ class TranslatedEPUBBuilder(EPUBBuilder):
         
         print(f"Will translate {sum(1 for t in all_texts if t[0] == 'chapter_title')} chapter titles")
         
+        # Start translating while later chapters are still being cleaned:
+        # segments go to the translator's background prefetch in chunks and
+        # land in its cache, so the translation pass below mostly hits it
+        prefetch = getattr(self.translator, 'prefetch', None)
+        pending = [t[2] for t in all_texts]
+        prefetched = []
+        
         # Clean chapters and collect content text
         for idx, chapter in enumerate(chapters):
             current_step += 1
             if progress_callback:
                 progress_callback(current_step, total_steps, f"Cleaning: {chapter.title[:30]}...")
             
-            # Clean content
+            # Clean content and extract Chinese text segments for
+            # translation from the same parse
             if self.cleaner:
-                chapter.content = self.cleaner.clean_html(chapter.content)
-            
-            # Extract Chinese text segments for translation
-            texts = self._extract_text_segments(chapter.content)
+                chapter.content, texts = self._clean_and_extract(chapter.content)
+            else:
+                texts = self._extract_text_segments(chapter.content)
             for text in texts:
-                if is_chinese(text) and len(text.strip()) > 0:
-                    all_texts.append(('content', idx, text))
+                all_texts.append(('content', idx, text))
+            
+            if prefetch:
+                pending.extend(texts)
+                if len(pending) >= PREFETCH_SEGMENTS:
+                    prefetched.extend(prefetch(pending))
+                    pending = []
+        
+        if prefetch and pending:
+            prefetched.extend(prefetch(pending))
+        # Report while the prefetch finishes (the callback is also where
+        # callers cancel the translator)
+        for done, _ in enumerate(concurrent.futures.as_completed(prefetched), 1):
+            if progress_callback:
+                progress_callback(current_step, total_steps, f"Translating: batch {done}/{len(prefetched)}")
         
         # Phase 2: Translate all texts in one batch (with multi-pass retry)
         if progress_callback:
@@ -336,7 +497,10 @@ class TranslatedEPUBBuilder(EPUBBuilder):
         print(f"Total segments to translate: {len(all_texts)}")
         
         if all_texts:
-            texts_to_translate = [t[2] for t in all_texts]
+            # Novels repeat a lot (names, honorifics, "第X章" headings), so
+            # send each distinct text once and fan the results back out
+            texts_to_translate = list(dict.fromkeys(t[2] for t in all_texts))
+            print(f"Distinct segments: {len(texts_to_translate)}")
             
             def translate_progress(completed, total):
                 nonlocal current_step
@@ -359,22 +523,33 @@ class TranslatedEPUBBuilder(EPUBBuilder):
             else:
                 translated = self.translator.translate_texts(texts_to_translate, translate_progress)
             
-            # Apply translations back
+            mapping = dict(zip(texts_to_translate, translated))
+            translated = [mapping.get(t[2]) for t in all_texts]
+            
+            # Apply translations back. Content segments are collected per
+            # chapter as (original, translation or None) and written in one
+            # pass below.
+            content_segments: Dict[int, List[Tuple[str, Optional[str]]]] = {}
             for i, (text_type, idx, original) in enumerate(all_texts):
-                if i < len(translated) and translated[i] and translated[i] != original:
+                result = translated[i] if i < len(translated) else None
+                if text_type == 'content':
+                    content_segments.setdefault(idx, []).append(
+                        (original, result if result and result != original else None)
+                    )
+                elif result and result != original:
                     if text_type == 'title':
-                        print(f"Translated title: {novel_info.title} -> {translated[i]}")
-                        novel_info.title = translated[i]
+                        print(f"Translated title: {novel_info.title} -> {result}")
+                        novel_info.title = result
                     elif text_type == 'author':
-                        print(f"Translated author: {novel_info.author} -> {translated[i]}")
-                        novel_info.author = translated[i]
+                        print(f"Translated author: {novel_info.author} -> {result}")
+                        novel_info.author = result
                     elif text_type == 'chapter_title':
                         # This is crucial - translating chapter titles fixes the TOC!
-                        chapters[idx].title = translated[i]
-                    elif text_type == 'content':
-                        chapters[idx].content = chapters[idx].content.replace(
-                            original, translated[i], 1
-                        )
+                        chapters[idx].title = result
+            
+            for idx, segments in content_segments.items():
+                if any(result for _, result in segments):
+                    chapters[idx].content = self._apply_text_segments(chapters[idx].content, segments)
         
         # Phase 2.5: Translation verification (from fixTranslate.py)
         if self.verify_translation:
@@ -391,7 +566,8 @@ class TranslatedEPUBBuilder(EPUBBuilder):
         print(f"Building EPUB with translated content...")
         print(f"  Final title: {novel_info.title}")
         print(f"  Final author: {novel_info.author}")
-        return self.build(novel_info, chapters, output_path, progress_callback)
+        # Chapters were cleaned in phase 1
+        return self.build(novel_info, chapters, output_path, progress_callback, release_content, clean=False)
     
     def _verify_translations(self, chapters: List[Chapter]):
         """
@@ -417,22 +593,86 @@ class TranslatedEPUBBuilder(EPUBBuilder):
                 print(f"    ... and {len(self.chapters_with_chinese) - 10} more")
             print("  These may need manual re-translation or the API failed silently.")
     
+    @staticmethod
+    def _parse_fragment(html: str):
+        """Parse chapter HTML into a wrapper <div> holding the fragment."""
+        return lxml_html.fragment_fromstring(html, create_parent='div')
+    
+    @staticmethod
+    def _iter_text_slots(root):
+        """
+        Yield (element, 'text'/'tail', value) for every text node that
+        needs translating, always in the same order for the same HTML.
+        """
+        for el in root.iter():
+            if isinstance(el.tag, str) and el.tag not in ('script', 'style'):
+                value = el.text
+                stripped = value.strip() if value else ''
+                if len(stripped) > 1 and is_chinese(stripped):
+                    yield el, 'text', value
+            if el is not root:
+                value = el.tail
+                stripped = value.strip() if value else ''
+                if len(stripped) > 1 and is_chinese(stripped):
+                    yield el, 'tail', value
+    
+    @staticmethod
+    def _serialize_fragment(root) -> str:
+        """Serialize a _parse_fragment tree without its wrapper <div>."""
+        return lxml_html.tostring(root, encoding='unicode')[len('<div>'):-len('</div>')]
+    
     def _extract_text_segments(self, html: str) -> List[str]:
-        """Extract text segments from HTML for translation."""
-        from bs4 import BeautifulSoup
-        
-        soup = BeautifulSoup(html, 'lxml')
-        texts = []
-        
-        # Get all text nodes
-        for element in soup.find_all(text=True):
-            text = str(element).strip()
-            if text and len(text) > 1:
-                # Skip if it's just whitespace or punctuation
-                if re.search(r'[\u4e00-\u9fff]', text):
-                    texts.append(text)
+        """Extract Chinese text segments (stripped) from HTML for translation."""
+        try:
+            root = self._parse_fragment(html)
+        except Exception:
+            return []
+        return [value.strip() for _, _, value in self._iter_text_slots(root)]
+    
+    def _clean_and_extract(self, html: str) -> Tuple[str, List[str]]:
+        """
+        Clean chapter HTML and extract its Chinese text segments from a
+        single parse. Returns (cleaned html, segments).
+        """
+        try:
+            root = self._parse_fragment(html)
+        except Exception:
+            cleaned = self.cleaner.clean_html(html)
+            return cleaned, self._extract_text_segments(cleaned)
+        
+        self.cleaner.clean_tree(root)
+        texts = [value.strip() for _, _, value in self._iter_text_slots(root)]
+        return self._serialize_fragment(root), texts
+    
+    def _apply_text_segments(self, html: str, segments: List[Tuple[str, Optional[str]]]) -> str:
+        """
+        Write translations back into the text nodes _extract_text_segments
+        found, serializing once. segments holds (original, translation or
+        None) in extraction order; a node is only rewritten if its text
+        still matches the original, so a reparse that shifts nodes can't
+        put a translation in the wrong place.
+        """
+        try:
+            root = self._parse_fragment(html)
+        except Exception:
+            return html
+        
+        pos = 0
+        for el, attr, value in list(self._iter_text_slots(root)):
+            if pos >= len(segments):
+                break
+            original, translation = segments[pos]
+            if value.strip() != original:
+                continue
+            pos += 1
+            if translation is None:
+                continue
+            # Keep the node's surrounding whitespace
+            lead = value[:len(value) - len(value.lstrip())]
+            trail = value[len(value.rstrip()):]
+            setattr(el, attr, lead + translation + trail)
         
-        return texts
+        return self._serialize_fragment(root)
     
     def get_translation_warnings(self) -> List[Tuple[str, int]]:
         """
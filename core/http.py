@@ -0,0 +1,106 @@
+# Author: joelsnl and Anthropic Claude
+"""
+Shared HTTP session
+One long-lived, connection-pooled session for requests that are not tied
+to a site parser (cover images, translation), so repeated requests to the
+same host reuse the connection instead of paying a new TCP+TLS handshake.
+
+Site parsers keep their own session because they set per-site headers
+(Referer, cookies) that must not leak into other requests, but build it
+with the same create_session() so pool and retry settings match.
+"""
+
+import atexit
+import threading
+import email.utils
+from datetime import datetime, timezone
+from typing import Optional
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# Longest Retry-After we honour in one wait, so a long ban can't hang a
+# download silently; the caller simply gets another 429 and waits again
+MAX_RETRY_AFTER = 300
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def create_session():
+    """Create a pooled session (curl_cffi if available, else requests)."""
+    try:
+        # curl_cffi keeps one curl handle per thread, so a single Session
+        # can be shared by worker threads
+        from curl_cffi.requests import Session as CurlSession
+        return CurlSession(impersonate="chrome120")
+    except ImportError:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        # Connection-level retries only; callers handle HTTP status retries
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=()),
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Connection': 'keep-alive',
+        })
+        return session
+
+
+def get_session():
+    """Get the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def close_session():
+    """Close the shared session's pooled connections (runs at exit)."""
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    if session is not None:
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_session)
+
+
+def retry_after(response) -> Optional[float]:
+    """
+    Seconds a 429/503 response asks us to wait (Retry-After, given as
+    seconds or an HTTP date), capped at MAX_RETRY_AFTER. None if the
+    response doesn't say.
+    """
+    value = response.headers.get('Retry-After') if response is not None else None
+    if not value:
+        return None
+    
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
@@ -6,26 +6,103 @@ All site-specific parsers inherit from BaseParser
 
 import re
 import time
+import functools
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
-from bs4 import BeautifulSoup
+from urllib.parse import urlsplit
+from lxml import etree, html as lxml_html
 
-# Try curl_cffi first (best TLS fingerprinting, lightweight)
-HTTP_CLIENT = None
+# HTTP client selection (curl_cffi, else requests) lives in create_session()
+from core.http import create_session, retry_after
 
-try:
-    from curl_cffi.requests import Session as CurlSession
-    HTTP_CLIENT = "curl_cffi"
-    print("Using curl_cffi (Chrome TLS fingerprinting)")
-except ImportError:
-    pass
 
-# Fallback to requests
-if not HTTP_CLIENT:
-    import requests
-    HTTP_CLIENT = "requests"
-    print("Warning: curl_cffi not installed. Run: pip install curl_cffi")
+# === lxml helpers ===
+# Parsers extract with precompiled lxml XPath, which is far faster than
+# a BeautifulSoup tree on large chapter lists and chapter pages.
+
+_TEXT_NODES = etree.XPath(".//text()")
+
+
+def has_class(name: str) -> str:
+    """XPath predicate matching a CSS class (like `.name` in a selector)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def first(nodes: list):
+    """Return the first XPath result, or None."""
+    return nodes[0] if nodes else None
+
+
+def node_text(el) -> str:
+    """Element text with each piece stripped (like get_text(strip=True))."""
+    return "".join(s.strip() for s in _TEXT_NODES(el))
+
+
+def outer_html(el) -> str:
+    """Serialize an element to HTML without its trailing text."""
+    return lxml_html.tostring(el, encoding='unicode', with_tail=False)
+
+
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# lxml parsers must not be shared between threads, so keep one per
+# thread per encoding
+_html_parsers = threading.local()
+
+
+def _empty_document():
+    """A bare <html><body></body></html> tree."""
+    return lxml_html.document_fromstring('<html><body></body></html>')
+
+
+def parse_html_bytes(content: bytes, encoding: Optional[str] = None):
+    """
+    Parse HTML from raw response bytes, letting lxml decode in C.
+    Without an encoding, lxml uses the page's <meta charset>.
+    An empty page gives an empty document (see parse_html_text).
+    """
+    parser = None
+    if encoding:
+        parsers = getattr(_html_parsers, 'by_encoding', None)
+        if parsers is None:
+            parsers = _html_parsers.by_encoding = {}
+        parser = parsers.get(encoding.lower())
+        if parser is None:
+            try:
+                parser = parsers[encoding.lower()] = lxml_html.HTMLParser(encoding=encoding)
+            except LookupError:
+                parser = None
+    try:
+        return lxml_html.fromstring(content, parser=parser)
+    except etree.ParserError:
+        return _empty_document()
+
+
+def parse_html_text(text: str):
+    """
+    Parse already-decoded HTML. lxml raises ParserError on an empty or
+    whitespace-only page; return an empty document instead, so the
+    parser's selectors find nothing and it falls back to its "Failed to
+    extract" placeholder rather than aborting the whole download.
+    """
+    try:
+        return lxml_html.fromstring(text)
+    except etree.ParserError:
+        return _empty_document()
+
+
+def _response_charset(response) -> Optional[str]:
+    """Charset from the Content-Type header, or None if it doesn't say."""
+    match = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    return match.group(1) if match else None
+
+
+def drop_all(nodes: list):
+    """Remove elements from the tree, keeping their tail text."""
+    for el in nodes:
+        el.drop_tree()
 
 
 @dataclass
@@ -52,6 +129,46 @@ class NovelInfo:
     source_url: str = ""
 
 
+class FetchCancelled(Exception):
+    """Raised by a parser's retry waits once its cancel_event is set."""
+
+
+class RateLimiter:
+    """
+    Request scheduler shared by concurrent download workers.
+
+    Each acquire() reserves the next start time (`delay` seconds after the
+    previous one), so several chapters can be in flight at once while the
+    site still sees the same request rate as the old one-request-then-sleep
+    loop. Up to `capacity` requests may start back to back after an idle
+    period.
+    """
+
+    def __init__(self, delay: float, capacity: int = 1):
+        self.delay = delay
+        self.capacity = capacity
+        self._next_ok = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        Block until this caller's request slot comes up.
+        Returns False as soon as cancel_event is set.
+        """
+        with self._lock:
+            now = time.monotonic()
+            # An idle limiter may fall behind "now" by at most the burst allowance
+            start = max(self._next_ok, now - (self.capacity - 1) * self.delay)
+            self._next_ok = start + self.delay
+            wait = start - now
+
+        if cancel_event is not None:
+            return not cancel_event.wait(wait) if wait > 0 else not cancel_event.is_set()
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+
 class BaseParser(ABC):
     """
     Base class for all site parsers.
@@ -62,29 +179,35 @@ class BaseParser(ABC):
     SITE_NAME = "Unknown"
     SITE_DOMAINS = []  # e.g., ["twkan.com", "www.twkan.com"]
     
+    # SITE_DOMAINS lowercased once per class, for host matching
+    _domains_lower = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._domains_lower = tuple(domain.lower() for domain in cls.SITE_DOMAINS)
+    
     def __init__(self):
-        if HTTP_CLIENT == "curl_cffi":
-            # curl_cffi with Chrome 120 impersonation
-            self.session = CurlSession(impersonate="chrome120")
-        else:
-            import requests
-            self.session = requests.Session()
-            self.session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            })
+        # Own session per parser (site headers/cookies), same pooled setup
+        # as the shared one: curl_cffi Chrome 120 impersonation, or requests
+        self.session = create_session()
         
         # Rate limiting - default 2 seconds between requests (like WebToEpub)
         self.request_delay = 2.0
         # 429 retry delays in seconds (like WebToEpub: 15, 30, 60, 120)
         self.rate_limit_delays = [15, 30, 60, 120]
+        # Set by the app; once it is set, retry waits end with FetchCancelled
+        # instead of sleeping out a (up to minutes long) backoff
+        self.cancel_event: Optional[threading.Event] = None
     
     @classmethod
     def can_handle(cls, url: str) -> bool:
         """Check if this parser can handle the given URL."""
-        for domain in cls.SITE_DOMAINS:
-            if domain in url.lower():
-                return True
-        return False
+        return cls.can_handle_host(_url_host(url))
+    
+    @classmethod
+    def can_handle_host(cls, host: str) -> bool:
+        """Check if this parser handles an already-lowercased host."""
+        return any(domain in host for domain in cls._domains_lower)
     
     @abstractmethod
     def get_novel_info(self, url: str) -> NovelInfo:
@@ -98,55 +221,19 @@ class BaseParser(ABC):
     def get_chapter_content(self, chapter: Chapter) -> str:
         pass
     
-    def fetch_page(self, url: str, retries: int = 3) -> BeautifulSoup:
-        """
-        Fetch a page and return BeautifulSoup object.
-        Handles 429 errors with longer waits (like WebToEpub).
-        """
-        last_error = None
-        rate_limit_retry = 0  # Track 429 retries separately
-        
-        for attempt in range(retries):
-            try:
-                response = self.session.get(url, timeout=30)
-                
-                # Check for 429 specifically
-                if response.status_code == 429:
-                    if rate_limit_retry < len(self.rate_limit_delays):
-                        wait = self.rate_limit_delays[rate_limit_retry]
-                        print(f"  Rate limited (429). Waiting {wait}s before retry...")
-                        time.sleep(wait)
-                        rate_limit_retry += 1
-                        continue  # Don't count as a regular retry
-                    else:
-                        response.raise_for_status()
-                
-                response.raise_for_status()
-                return BeautifulSoup(response.text, 'lxml')
-                
-            except Exception as e:
-                last_error = e
-                error_str = str(e)
-                
-                # Check if it's a 429 error from exception
-                if '429' in error_str:
-                    if rate_limit_retry < len(self.rate_limit_delays):
-                        wait = self.rate_limit_delays[rate_limit_retry]
-                        print(f"  Rate limited (429). Waiting {wait}s before retry...")
-                        time.sleep(wait)
-                        rate_limit_retry += 1
-                        continue
-                
-                print(f"  Attempt {attempt + 1}/{retries} failed: {e}")
-                if attempt < retries - 1:
-                    wait = 2 ** (attempt + 1)
-                    print(f"  Retrying in {wait}s...")
-                    time.sleep(wait)
-        
-        raise last_error
+    def _backoff(self, seconds: float):
+        """Sleep before a retry; raises FetchCancelled if cancel_event is set meanwhile."""
+        if self.cancel_event is None:
+            time.sleep(seconds)
+        elif self.cancel_event.wait(seconds):
+            raise FetchCancelled("Cancelled by user")
     
     def fetch_html(self, url: str, retries: int = 3) -> str:
         """Fetch page and return raw HTML string with 429 handling."""
+        return self._fetch_response(url, retries).text
+    
+    def _fetch_response(self, url: str, retries: int = 3):
+        """Fetch a URL with 429 handling and retries, returning the response."""
         last_error = None
         rate_limit_retry = 0
         
@@ -157,50 +244,98 @@ class BaseParser(ABC):
                 # Check for 429 specifically
                 if response.status_code == 429:
                     if rate_limit_retry < len(self.rate_limit_delays):
-                        wait = self.rate_limit_delays[rate_limit_retry]
-                        print(f"  Rate limited (429). Waiting {wait}s before retry...")
-                        time.sleep(wait)
+                        wait = retry_after(response) or self.rate_limit_delays[rate_limit_retry]
+                        print(f"  Rate limited (429). Waiting {wait:g}s before retry...")
+                        self._backoff(wait)
                         rate_limit_retry += 1
                         continue
                 
                 response.raise_for_status()
-                return response.text
+                return response
                 
+            except FetchCancelled:
+                raise
             except Exception as e:
                 last_error = e
                 error_str = str(e)
                 
                 if '429' in error_str:
                     if rate_limit_retry < len(self.rate_limit_delays):
-                        wait = self.rate_limit_delays[rate_limit_retry]
-                        print(f"  Rate limited (429). Waiting {wait}s before retry...")
-                        time.sleep(wait)
+                        wait = (retry_after(getattr(e, 'response', None))
+                                or self.rate_limit_delays[rate_limit_retry])
+                        print(f"  Rate limited (429). Waiting {wait:g}s before retry...")
+                        self._backoff(wait)
                         rate_limit_retry += 1
                         continue
                 
                 print(f"  Attempt {attempt + 1}/{retries} failed: {e}")
                 if attempt < retries - 1:
-                    time.sleep(2 ** (attempt + 1))
+                    self._backoff(2 ** (attempt + 1))
         
         raise last_error
+    
+    def fetch_tree(self, url: str, retries: int = 3):
+        """Fetch a page and return an lxml HTML tree for XPath extraction."""
+        response = self._fetch_response(url, retries)
+        return parse_html_bytes(response.content, _response_charset(response))
 
 
 # Registry of all parsers
 _parser_registry: List[type] = []
 
+# One regex over every registered domain, group "p<i>" = registry index.
+# Rebuilt lazily after each registration.
+_dispatch_pattern: Optional[re.Pattern] = None
+
 
 def register_parser(parser_class: type):
     """Decorator to register a parser class."""
+    global _dispatch_pattern
     _parser_registry.append(parser_class)
+    _dispatch_pattern = None
+    _parser_class_for_host.cache_clear()
     return parser_class
 
 
+def _url_host(url: str) -> str:
+    """Lowercased host of a URL (the whole string if it has no scheme)."""
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        host = None
+    return host or url.lower()
+
+
+def _build_dispatch_pattern() -> re.Pattern:
+    """Compile all parser domains into a single alternation."""
+    groups = [
+        f"(?P<p{i}>{'|'.join(re.escape(d) for d in parser_class.SITE_DOMAINS)})"
+        for i, parser_class in enumerate(_parser_registry)
+        if parser_class.SITE_DOMAINS
+    ]
+    # (?!) never matches, for an empty registry
+    return re.compile('|'.join(groups) or '(?!)', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _parser_class_for_host(host: str) -> Optional[type]:
+    """Resolve a host to its parser class (memoized, cleared on registration)."""
+    global _dispatch_pattern
+    if _dispatch_pattern is None:
+        _dispatch_pattern = _build_dispatch_pattern()
+    
+    match = _dispatch_pattern.search(host)
+    if not match:
+        return None
+    return _parser_registry[int(match.lastgroup[1:])]
+
+
 def get_parser_for_url(url: str) -> Optional[BaseParser]:
     """Find and instantiate the appropriate parser for a URL."""
-    for parser_class in _parser_registry:
-        if parser_class.can_handle(url):
-            return parser_class()
-    return None
+    # Each call still gets a fresh parser: instances hold their own
+    # session and per-site state
+    parser_class = _parser_class_for_host(_url_host(url))
+    return parser_class() if parser_class else None
 
 
 def get_supported_sites() -> List[str]:
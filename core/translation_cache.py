@@ -0,0 +1,129 @@
+# Author: joelsnl and Anthropic Claude
+"""
+Persistent translation cache
+SQLite-backed store of translated texts so re-downloading a novel (or
+retrying after a failure) doesn't translate the same paragraphs again.
+
+Entries are keyed by a 16-byte BLAKE2b hash of the source text and the
+language pair. New entries are buffered and written in one transaction
+per flush(); least recently used entries are evicted when the database
+grows past max_bytes.
+"""
+
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+# Default size cap for the cache database
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+
+class TranslationCache:
+    """Thread-safe on-disk LRU cache of translations."""
+
+    def __init__(self, path: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        # Shared by translator worker threads; access is serialized by _lock
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tx ("
+            "h BLOB NOT NULL, lang TEXT NOT NULL, result TEXT NOT NULL, "
+            "last_used REAL NOT NULL, PRIMARY KEY (h, lang))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS tx_last_used ON tx(last_used)")
+        self._conn.commit()
+
+        # Writes waiting for the next flush(), and hits whose last_used
+        # timestamp still needs bumping
+        self._pending: Dict[Tuple[bytes, str], str] = {}
+        self._touched: Dict[Tuple[bytes, str], float] = {}
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Hash source text to a compact key."""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    def get(self, text: str, lang: str) -> Optional[str]:
+        """Return the cached translation of text, or None."""
+        key = (self._key(text), lang)
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+
+            row = self._conn.execute(
+                "SELECT result FROM tx WHERE h=? AND lang=?", key
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._touched[key] = time.time()
+            return row[0]
+
+    def put(self, text: str, lang: str, result: str):
+        """Queue a translation to be written on the next flush()."""
+        with self._lock:
+            self._pending[(self._key(text), lang)] = result
+
+    def discard(self, text: str, lang: str):
+        """Forget a translation (e.g. one that came back untranslated)."""
+        key = (self._key(text), lang)
+        with self._lock:
+            self._pending.pop(key, None)
+            self._touched.pop(key, None)
+            self._conn.execute("DELETE FROM tx WHERE h=? AND lang=?", key)
+            self._conn.commit()
+
+    def flush(self):
+        """Write pending entries in a single transaction, then evict if needed."""
+        with self._lock:
+            if not self._pending and not self._touched:
+                return
+
+            now = time.time()
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO tx (h, lang, result, last_used) VALUES (?, ?, ?, ?)",
+                    [(h, lang, result, now) for (h, lang), result in self._pending.items()]
+                )
+                self._conn.executemany(
+                    "UPDATE tx SET last_used=? WHERE h=? AND lang=?",
+                    [(used, h, lang) for (h, lang), used in self._touched.items()]
+                )
+            self._pending.clear()
+            self._touched.clear()
+
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the database fits max_bytes."""
+        page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        used = (page_count - free_pages) * page_size
+        if used <= self.max_bytes:
+            return
+
+        # Trim to 90% of the cap so we don't evict again on every flush
+        rows = self._conn.execute("SELECT COUNT(*) FROM tx").fetchone()[0]
+        keep = int(rows * (self.max_bytes * 0.9) / used)
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM tx WHERE rowid NOT IN "
+                "(SELECT rowid FROM tx ORDER BY last_used DESC LIMIT ?)",
+                (keep,)
+            )
+        print(f"Translation cache: evicted {rows - keep} old entries")
+
+    def close(self):
+        """Flush pending entries and close the database."""
+        self.flush()
+        with self._lock:
+            self._conn.close()
@@ -9,24 +9,124 @@ Persistent retry system:
 - Stall detection: if no progress for 3+ passes, switches to maximum backoff
 - Cache is cleared for failed entries before each retry so fresh requests are made
 - Cancellable at any point via cancel() method
+- With curl_cffi installed, larger batches run as coroutines on one
+  AsyncSession (HTTP/2 multiplexed) that lives as long as the translator,
+  on its own event-loop thread; small batches, and everything without
+  curl_cffi, go through the shared pooled session on threads
+- close() releases the AsyncSession and its loop
 """
 
 import re
-import requests
 import time
+import queue
+import asyncio
 import threading
 import concurrent.futures
 from typing import List, Tuple, Dict, Optional, Callable
 
+try:
+    # orjson parses straight from response bytes and is several times faster
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+try:
+    # Async curl_cffi runs all requests on one event loop, multiplexed over
+    # HTTP/2, instead of one thread per request in flight
+    from curl_cffi.requests import AsyncSession
+except ImportError:
+    AsyncSession = None
+
+from core.http import USER_AGENT, get_session, retry_after
+from core.translation_cache import TranslationCache
+
+# CJK Unified Ideographs + Extension A
+_CJK_RE = re.compile(r'[\u4e00-\u9fff\u3400-\u4dbf]')
+
+
+class _AdaptiveLimit:
+    """
+    AIMD cap on translation requests in flight. Each 429 halves the cap;
+    every `step` texts translated without one raise it by 1, back up to
+    the configured worker count. Keeps a rate-limited run near Google's
+    actual ceiling instead of every worker hitting the backoff wall at once.
+    """
+    
+    def __init__(self, maximum: int, step: int = 100):
+        self.maximum = max(1, maximum)
+        self.limit = self.maximum
+        self.step = step
+        self._active = 0
+        self._successes = 0
+        self._last_cut = 0.0
+        self._cond = threading.Condition()
+    
+    def try_acquire(self) -> bool:
+        """Take a slot if one is free."""
+        with self._cond:
+            if self._active >= self.limit:
+                return False
+            self._active += 1
+            return True
+    
+    def acquire(self):
+        """Block until a slot is free, then take it."""
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+    
+    async def acquire_async(self):
+        """acquire() for coroutines, polling so the event loop isn't blocked."""
+        while not self.try_acquire():
+            await asyncio.sleep(0.05)
+    
+    def release(self):
+        """Give a slot back."""
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+    
+    def rate_limited(self):
+        """Multiplicative decrease after a 429."""
+        with self._cond:
+            # The requests already in flight tend to come back 429 together;
+            # count them as one signal
+            now = time.monotonic()
+            if now - self._last_cut < 1.0:
+                return
+            self._last_cut = now
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+    
+    def succeeded(self, texts: int = 1):
+        """Additive increase once `step` texts went through."""
+        with self._cond:
+            self._successes += texts
+            if self._successes >= self.step and self.limit < self.maximum:
+                self._successes = 0
+                self.limit += 1
+                self._cond.notify()
+
 
 class GoogleTranslator:
     """Google Translate Free API with concurrent requests, retry logic, and multi-pass retry."""
     
     ENDPOINT = 'https://translate.googleapis.com/translate_a/single'
-    USER_AGENT = (
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
-        '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    )
+    
+    # Longest text sent with GET (longer texts are POSTed); also the size
+    # short segments are packed up to, so a pack is still one GET
+    GET_LIMIT = 1800
+    
+    # Threads translating prefetch() packs in the background
+    PREFETCH_WORKERS = 16
+    
+    # Batches with fewer packs than this use the pooled sync session on
+    # threads; the AsyncSession only pays off for many requests at once
+    ASYNC_MIN_PACKS = 8
+    USER_AGENT = USER_AGENT
     
     def __init__(
         self,
@@ -36,6 +136,8 @@ class GoogleTranslator:
         request_timeout: int = 15,
         max_retries: int = 5,
         request_interval: float = 0.0,
+        persistent_cache: Optional[TranslationCache] = None,
+        session=None,
     ):
         self.source_lang = source_lang
         self.target_lang = target_lang
@@ -44,6 +146,16 @@ class GoogleTranslator:
         self.max_retries = max_retries
         self.request_interval = request_interval
         
+        # HTTP session; defaults to the app-wide pooled one
+        self.session = session
+        
+        # Requests in flight, shrunk while Google answers 429
+        self._limit = _AdaptiveLimit(max_workers)
+        
+        # Optional on-disk cache shared across runs
+        self.persistent_cache = persistent_cache
+        self._cache_lang = f"{source_lang}>{target_lang}"
+        
         # Statistics
         self.stats = {
             'requests': 0,
@@ -59,23 +171,43 @@ class GoogleTranslator:
         self.cache: Dict[str, str] = {}
         self.cache_lock = threading.Lock()
         self.stats_lock = threading.Lock()
-        self.progress_lock = threading.Lock()
-        
-        # Progress tracking
-        self.completed = 0
-        self.total = 0
-        self.progress_callback: Optional[Callable[[int, int], None]] = None
         
         # Failed texts for reporting
         self.failed_texts: List[Tuple[int, str]] = []
         self.failed_lock = threading.Lock()
         
-        # Control flag
-        self._cancel_requested = False
+        # Set by cancel(); retry and cooldown waits wake on it, so a cancel
+        # (e.g. the window closing) doesn't sit out a backoff first
+        self._cancel_event = threading.Event()
+        
+        # Background pool for prefetch(), created on first use
+        self._prefetch_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._prefetch_lock = threading.Lock()
+        
+        # Event loop thread and AsyncSession for large batches, created on
+        # first use and kept until close() so connections stay warm
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._async_session = None
+        self._async_lock = threading.Lock()
     
     def cancel(self):
-        """Request cancellation of ongoing translation."""
-        self._cancel_requested = True
+        """Request cancellation of ongoing and later translation (final for this instance)."""
+        self._cancel_event.set()
+    
+    @property
+    def _cancel_requested(self) -> bool:
+        """True once cancel() has been called."""
+        return self._cancel_event.is_set()
+    
+    async def _sleep_async(self, seconds: float):
+        """asyncio.sleep() that ends early once cancel() is called."""
+        deadline = time.monotonic() + seconds
+        while not self._cancel_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, 0.25))
     
     def _translate_single(self, text: str, index: int) -> Tuple[int, str]:
         """Translate a single text with exponential backoff retry."""
@@ -87,100 +219,357 @@ class GoogleTranslator:
         
         cache_key = text.strip()
         
-        # Check cache
-        with self.cache_lock:
-            if cache_key in self.cache:
-                with self.stats_lock:
-                    self.stats['cache_hits'] += 1
-                self._update_progress()
-                return (index, self.cache[cache_key])
-        
-        params = {
-            'client': 'gtx',
-            'sl': self.source_lang,
-            'tl': self.target_lang,
-            'dt': 't',
-            'dj': '1',
-            'q': text
-        }
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return (index, cached)
         
-        last_error = None
         for attempt in range(self.max_retries):
             if self._cancel_requested:
                 return (index, text)
                 
             try:
-                # Use GET for short texts, POST for long texts
-                if len(text) <= 1800:
-                    response = requests.get(
-                        self.ENDPOINT,
-                        params=params,
-                        headers={'User-Agent': self.USER_AGENT},
-                        timeout=self.request_timeout
-                    )
-                else:
-                    response = requests.post(
-                        self.ENDPOINT,
-                        data=params,
-                        headers={'User-Agent': self.USER_AGENT},
-                        timeout=self.request_timeout
-                    )
-                
-                response.raise_for_status()
-                data = response.json()
+                translated = self._request(text)
+                self._store(cache_key, translated)
+                self._count_request(1, len(text), attempt)
                 
-                # Extract translated text
-                translated = ''.join(
-                    s.get('trans', '') 
-                    for s in data.get('sentences', []) 
-                    if 'trans' in s
-                )
+                if self.request_interval > 0:
+                    self._cancel_event.wait(self.request_interval)
                 
-                if translated and translated.strip():
-                    # Cache the result
-                    with self.cache_lock:
-                        self.cache[cache_key] = translated
-                    
-                    with self.stats_lock:
-                        self.stats['requests'] += 1
-                        self.stats['paragraphs_translated'] += 1
-                        self.stats['characters_translated'] += len(text)
-                        if attempt > 0:
-                            self.stats['retries'] += attempt
-                    
-                    self._update_progress()
-                    
-                    if self.request_interval > 0:
-                        time.sleep(self.request_interval)
-                    
-                    return (index, translated)
-                else:
-                    raise ValueError("Empty translation response")
+                return (index, translated)
                     
             except Exception as e:
-                last_error = e
                 if attempt < self.max_retries - 1:
-                    # Exponential backoff: 2, 4, 8, 16... seconds
-                    wait_time = 2 ** (attempt + 1)
-                    time.sleep(wait_time)
+                    # Wait as long as a 429 asks, else exponential
+                    # backoff: 2, 4, 8, 16... seconds
+                    wait_time = retry_after(getattr(e, 'response', None)) or 2 ** (attempt + 1)
+                    self._cancel_event.wait(wait_time)
         
         # All retries failed
+        self._record_failure(index, text)
+        return (index, text)  # Return original on failure
+    
+    async def _translate_single_async(self, session, text: str, index: int) -> Tuple[int, str]:
+        """Async twin of _translate_single, for the AsyncSession path."""
+        if self._cancel_requested or not text or not text.strip():
+            return (index, text)
+        
+        cache_key = text.strip()
+        
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return (index, cached)
+        
+        for attempt in range(self.max_retries):
+            if self._cancel_requested:
+                return (index, text)
+            
+            try:
+                translated = await self._request_async(session, text)
+                self._store(cache_key, translated)
+                self._count_request(1, len(text), attempt)
+                
+                if self.request_interval > 0:
+                    await self._sleep_async(self.request_interval)
+                
+                return (index, translated)
+            
+            except Exception as e:
+                if attempt < self.max_retries - 1:
+                    await self._sleep_async(retry_after(getattr(e, 'response', None)) or 2 ** (attempt + 1))
+        
+        self._record_failure(index, text)
+        return (index, text)
+    
+    def _count_request(self, paragraphs: int, characters: int, retries: int = 0):
+        """Record one successful request in the stats."""
+        with self.stats_lock:
+            self.stats['requests'] += 1
+            self.stats['paragraphs_translated'] += paragraphs
+            self.stats['characters_translated'] += characters
+            if retries > 0:
+                self.stats['retries'] += retries
+    
+    def _record_failure(self, index: int, text: str):
+        """Record a text that failed every retry."""
         with self.failed_lock:
             preview = text[:50] + '...' if len(text) > 50 else text
             self.failed_texts.append((index, preview))
         
         with self.stats_lock:
             self.stats['errors'] += 1
+    
+    def _get_cached(self, cache_key: str) -> Optional[str]:
+        """Look up a translation in the memory cache, then the on-disk cache."""
+        # dict.get is atomic under the GIL; only writes take cache_lock
+        cached = self.cache.get(cache_key)
         
-        self._update_progress()
-        return (index, text)  # Return original on failure
+        if cached is None and self.persistent_cache:
+            cached = self.persistent_cache.get(cache_key, self._cache_lang)
+            if cached is not None:
+                with self.cache_lock:
+                    self.cache[cache_key] = cached
+        
+        if cached is not None:
+            with self.stats_lock:
+                self.stats['cache_hits'] += 1
+        return cached
+    
+    def _store(self, cache_key: str, translated: str):
+        """Cache a successful translation in memory and on disk."""
+        with self.cache_lock:
+            self.cache[cache_key] = translated
+        if self.persistent_cache:
+            self.persistent_cache.put(cache_key, self._cache_lang, translated)
+    
+    def _request_params(self, text: str) -> dict:
+        """Query parameters for translating text."""
+        return {
+            'client': 'gtx',
+            'sl': self.source_lang,
+            'tl': self.target_lang,
+            'dt': 't',
+            'dj': '1',
+            'q': text
+        }
     
-    def _update_progress(self):
-        """Update progress counter and call callback if set."""
-        with self.progress_lock:
-            self.completed += 1
-            if self.progress_callback and self.total > 0:
-                self.progress_callback(self.completed, self.total)
+    @staticmethod
+    def _parse_response(response) -> str:
+        """Extract the translated text from a response; raises if there is none."""
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        
+        # Extract translated text
+        translated = ''.join(
+            s.get('trans', '') 
+            for s in data.get('sentences', []) 
+            if 'trans' in s
+        )
+        
+        if not translated or not translated.strip():
+            raise ValueError("Empty translation response")
+        return translated
+    
+    def _request(self, text: str) -> str:
+        """Send one translation request; raises on HTTP errors or empty results."""
+        params = self._request_params(text)
+        
+        # Use GET for short texts, POST for long texts. The shared session
+        # (curl_cffi Chrome impersonation, or requests with the same UA)
+        # keeps the connection to Google alive and already sends the
+        # browser headers.
+        session = self.session or get_session()
+        self._limit.acquire()
+        try:
+            if len(text) <= self.GET_LIMIT:
+                response = session.get(self.ENDPOINT, params=params, timeout=self.request_timeout)
+            else:
+                response = session.post(self.ENDPOINT, data=params, timeout=self.request_timeout)
+        finally:
+            self._limit.release()
+        return self._check_response(response, text)
+    
+    async def _request_async(self, session, text: str) -> str:
+        """Async twin of _request on a curl_cffi AsyncSession."""
+        params = self._request_params(text)
+        await self._limit.acquire_async()
+        try:
+            if len(text) <= self.GET_LIMIT:
+                response = await session.get(self.ENDPOINT, params=params, timeout=self.request_timeout)
+            else:
+                response = await session.post(self.ENDPOINT, data=params, timeout=self.request_timeout)
+        finally:
+            self._limit.release()
+        return self._check_response(response, text)
+    
+    def _check_response(self, response, text: str) -> str:
+        """Parse a response and feed its outcome to the adaptive limit."""
+        if response.status_code == 429:
+            self._limit.rate_limited()
+        translated = self._parse_response(response)
+        self._limit.succeeded(text.count('\n') + 1)
+        return translated
+    
+    def _pack_segments(self, items: List[Tuple[int, str]]) -> List[List[Tuple[int, str]]]:
+        """
+        Group (index, text) items into packs of up to GET_LIMIT characters
+        that can be sent newline-joined in one request. Texts containing
+        newlines, or too long to share a request, go alone.
+        """
+        packs = []
+        current: List[Tuple[int, str]] = []
+        size = 0
+        for index, text in items:
+            if '\n' in text or len(text) > self.GET_LIMIT // 2:
+                packs.append([(index, text)])
+                continue
+            if current and size + len(text) + 1 > self.GET_LIMIT:
+                packs.append(current)
+                current, size = [], 0
+            current.append((index, text))
+            size += len(text) + 1
+        if current:
+            packs.append(current)
+        return packs
+    
+    def _unpack(self, pack: List[Tuple[int, str]], translated: str) -> Optional[List[Tuple[int, str]]]:
+        """
+        Split a pack's translation back into its texts and cache them.
+        Returns None if the line count doesn't match the pack.
+        """
+        lines = translated.split('\n')
+        if len(lines) != len(pack) or not all(line.strip() for line in lines):
+            return None
+        
+        results = []
+        for (index, text), line in zip(pack, lines):
+            self._store(text.strip(), line.strip())
+            results.append((index, line.strip()))
+        
+        self._count_request(len(pack), sum(len(text) for _, text in pack))
+        return results
+    
+    def _translate_pack(self, pack: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+        """
+        Translate a pack of short texts with one request, falling back to
+        one request per text if the reply doesn't split back into the
+        same number of lines.
+        """
+        if len(pack) > 1 and not self._cancel_requested:
+            try:
+                results = self._unpack(pack, self._request('\n'.join(text for _, text in pack)))
+                if results is not None:
+                    if self.request_interval > 0:
+                        self._cancel_event.wait(self.request_interval)
+                    return results
+            except Exception:
+                pass
+        
+        return [self._translate_single(text, index) for index, text in pack]
+    
+    async def _translate_pack_async(self, session, pack: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+        """Async twin of _translate_pack."""
+        if len(pack) > 1 and not self._cancel_requested:
+            try:
+                translated = await self._request_async(session, '\n'.join(text for _, text in pack))
+                results = self._unpack(pack, translated)
+                if results is not None:
+                    if self.request_interval > 0:
+                        await self._sleep_async(self.request_interval)
+                    return results
+            except Exception:
+                pass
+        
+        return [await self._translate_single_async(session, text, index) for index, text in pack]
+    
+    async def _translate_packs_async(
+        self,
+        packs: List[List[Tuple[int, str]]],
+        max_workers: int,
+        done_queue: queue.Queue
+    ):
+        """
+        Run all packs as coroutines over the translator's AsyncSession.
+        curl multiplexes them over a few HTTP/2 connections instead of one
+        thread (and TLS connection) per worker; max_workers caps requests
+        in flight. Puts (pack, results) on done_queue as each pack
+        finishes, then None.
+        """
+        try:
+            if self._async_session is None:
+                self._async_session = AsyncSession(impersonate="chrome120", max_clients=self.max_workers)
+            session = self._async_session
+            semaphore = asyncio.Semaphore(max_workers)
+            
+            async def run(pack):
+                async with semaphore:
+                    try:
+                        return pack, await self._translate_pack_async(session, pack)
+                    except Exception:
+                        return pack, []  # Pack keeps its original texts
+            
+            for task in asyncio.as_completed([run(pack) for pack in packs]):
+                done_queue.put(await task)
+        finally:
+            done_queue.put(None)
+    
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """The translator's event loop, started on a daemon thread on first use."""
+        with self._async_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="translate-loop", daemon=True)
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+    
+    def close(self):
+        """
+        Close the AsyncSession and stop its event loop, if they were started.
+        Call once no translation is running (the app does so when a
+        download finishes and at exit).
+        """
+        with self._async_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            session, self._async_session = self._async_session, None
+            if session is not None:
+                try:
+                    asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=5)
+                except Exception:
+                    pass
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            if not thread.is_alive():
+                loop.close()
+        
+        with self._prefetch_lock:
+            pool, self._prefetch_pool = self._prefetch_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def prefetch(self, texts: List[str]) -> List[concurrent.futures.Future]:
+        """
+        Start translating texts into the cache in the background, so a
+        later translate_texts() call finds them already done. One attempt
+        per pack, no progress or failure reporting; whatever doesn't make
+        it is simply translated (with retries) by that later call.
+        Returns the futures of the submitted packs.
+        """
+        items = []
+        seen = set()
+        for text in texts:
+            key = text.strip() if text else ''
+            if not key or key in seen or key in self.cache:
+                continue
+            if self.persistent_cache and self.persistent_cache.get(key, self._cache_lang) is not None:
+                continue
+            seen.add(key)
+            items.append((len(items), text))
+        
+        if not items:
+            return []
+        
+        with self._prefetch_lock:
+            if self._prefetch_pool is None:
+                self._prefetch_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.PREFETCH_WORKERS, thread_name_prefix="translate-prefetch"
+                )
+        return [self._prefetch_pool.submit(self._prefetch_pack, pack) for pack in self._pack_segments(items)]
+    
+    def _prefetch_pack(self, pack: List[Tuple[int, str]]):
+        """Translate one prefetch pack into the cache (single attempt)."""
+        if self._cancel_requested:
+            return
+        try:
+            if len(pack) > 1:
+                self._unpack(pack, self._request('\n'.join(text for _, text in pack)))
+            else:
+                text = pack[0][1]
+                self._store(text.strip(), self._request(text))
+                self._count_request(1, len(text))
+        except Exception:
+            pass  # Left for the main pass to retry
     
     def translate_texts(
         self,
@@ -200,32 +589,97 @@ class GoogleTranslator:
         if not texts:
             return []
         
-        self._cancel_requested = False
-        self.total = len(texts)
-        self.completed = 0
         self.failed_texts = []
-        self.progress_callback = progress_callback
         
-        workers = min(self.max_workers, len(texts))
-        results = [''] * len(texts)
+        results = self._translate_batch(texts, self.max_workers, progress_callback)
+        
+        # Write this batch's new translations in one transaction
+        if self.persistent_cache:
+            self.persistent_cache.flush()
+        
+        return results
+    
+    def _translate_batch(
+        self,
+        texts: List[str],
+        max_workers: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[str]:
+        """
+        Translate texts concurrently, sending each distinct text only once.
+        Novels repeat a lot of short strings (headings, stock phrases), so
+        duplicates in the batch share a single request. Cached texts are
+        answered up front and the rest are packed several to a request.
+        
+        Progress counts distinct texts and is reported from the calling
+        thread as each pack finishes, never from the workers.
+        """
+        # Map each input to a slot in the de-duplicated list
+        unique: Dict[str, int] = {}
+        slots = [unique.setdefault(text, len(unique)) for text in texts]
+        unique_texts = list(unique)
+        total = len(unique_texts)
+        
+        # Originals stand in for anything cancelled or failed
+        unique_results = list(unique_texts)
+        to_fetch = []
+        for i, text in enumerate(unique_texts):
+            if not text or not text.strip():
+                continue
+            cached = self._get_cached(text.strip())
+            if cached is not None:
+                unique_results[i] = cached
+            else:
+                to_fetch.append((i, text))
+        
+        # Blank and cached texts are done already
+        done = total - len(to_fetch)
+        if progress_callback and done:
+            progress_callback(done, total)
+        
+        def on_pack_done(pack, pack_results):
+            nonlocal done
+            for index, translated in pack_results:
+                unique_results[index] = translated
+            done += len(pack)
+            if progress_callback:
+                progress_callback(done, total)
+        
+        packs = self._pack_segments(to_fetch)
+        if not packs:
+            return [unique_results[slot] for slot in slots]
+        
+        # A single pack (e.g. a few titles) runs right here: no pool to spin up
+        if len(packs) == 1:
+            on_pack_done(packs[0], self._translate_pack(packs[0]))
+            return [unique_results[slot] for slot in slots]
+        
+        workers = min(max_workers, len(packs))
+        if AsyncSession is not None and self.session is None and len(packs) >= self.ASYNC_MIN_PACKS:
+            # Coroutines run on the translator's loop thread; results come
+            # back through a queue so progress is still reported from here
+            done_queue: queue.Queue = queue.Queue()
+            future = asyncio.run_coroutine_threadsafe(
+                self._translate_packs_async(packs, workers, done_queue), self._event_loop()
+            )
+            for item in iter(done_queue.get, None):
+                on_pack_done(*item)
+            future.result()
+            return [unique_results[slot] for slot in slots]
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-            futures = {
-                executor.submit(self._translate_single, text, i): i 
-                for i, text in enumerate(texts)
-            }
+            futures = {executor.submit(self._translate_pack, pack): pack for pack in packs}
             
             for future in concurrent.futures.as_completed(futures):
                 if self._cancel_requested:
                     break
                 try:
-                    index, translated = future.result()
-                    results[index] = translated
+                    pack_results = future.result()
                 except Exception:
-                    index = futures[future]
-                    results[index] = texts[index]
+                    pack_results = []  # Pack keeps its original texts
+                on_pack_done(futures[future], pack_results)
         
-        return results
+        return [unique_results[slot] for slot in slots]
     
     def translate_texts_with_retry(
         self,
@@ -338,11 +792,8 @@ class GoogleTranslator:
             # ── Cooldown between passes ──
             if cooldown > 0:
                 print(f"  ⏳ Cooling down for {cooldown}s before retry...")
-                # Sleep in 1s chunks so cancellation is responsive
-                for _ in range(cooldown):
-                    if self._cancel_requested:
-                        break
-                    time.sleep(1)
+                # Wakes as soon as cancel() is called
+                self._cancel_event.wait(cooldown)
             
             if self._cancel_requested:
                 break
@@ -352,6 +803,9 @@ class GoogleTranslator:
                 for i in failed_indices:
                     cache_key = texts[i].strip()
                     self.cache.pop(cache_key, None)
+            if self.persistent_cache:
+                for i in failed_indices:
+                    self.persistent_cache.discard(texts[i].strip(), self._cache_lang)
             
             # ── Apply retry settings ──
             old_interval = self.request_interval
@@ -359,27 +813,12 @@ class GoogleTranslator:
             self.request_interval = max(interval, old_interval)
             self.max_retries = old_max_retries + extra_retry
             
-            # Reset progress
-            self.total = len(failed_indices)
-            self.completed = 0
-            
-            # ── Translate failed texts ──
+            # ── Translate failed texts (progress resets per pass) ──
             failed_texts = [texts[i] for i in failed_indices]
-            retry_results = [''] * len(failed_texts)
+            retry_results = self._translate_batch(failed_texts, retry_workers, progress_callback)
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=retry_workers) as executor:
-                futures = {
-                    executor.submit(self._translate_single, text, idx): idx
-                    for idx, text in enumerate(failed_texts)
-                }
-                for future in concurrent.futures.as_completed(futures):
-                    if self._cancel_requested:
-                        break
-                    try:
-                        idx, translated = future.result()
-                        retry_results[idx] = translated
-                    except Exception:
-                        pass
+            if self.persistent_cache:
+                self.persistent_cache.flush()
             
             # ── Apply only improved translations ──
             improved = 0
@@ -413,27 +852,43 @@ class GoogleTranslator:
         results = self.translate_texts([text])
         return results[0] if results else text
     
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate several short single-line texts (e.g. titles).
+        
+        translate_texts() already packs short texts into shared requests, and
+        caches (in memory and on disk) each text under its own key, so a
+        title is reused from any later batch it appears in.
+        """
+        return self.translate_texts(texts)
+    
     @staticmethod
     def _contains_chinese(text: str) -> bool:
         """Check if text contains Chinese characters."""
-        if not text:
+        if not text or text.isascii():
             return False
-        return bool(re.search(r'[\u4e00-\u9fff\u3400-\u4dbf]', text))
+        return _CJK_RE.search(text) is not None
     
     @staticmethod
     def _count_chinese(text: str) -> int:
         """Count Chinese characters in text."""
-        if not text:
+        if not text or text.isascii():
             return 0
-        return len(re.findall(r'[\u4e00-\u9fff\u3400-\u4dbf]', text))
+        return len(_CJK_RE.findall(text))
     
     @staticmethod
     def is_chinese(text: str) -> bool:
         """Check if text contains significant Chinese characters."""
-        if not text:
+        if not text or text.isascii():
             return False
-        chinese_count = len(re.findall(r'[\u4e00-\u9fff\u3400-\u4dbf]', text))
-        return chinese_count > len(text) * 0.1  # More than 10% Chinese
+        # More than 10% Chinese; stop counting as soon as that's reached
+        threshold = len(text) // 10 + 1
+        count = 0
+        for _ in _CJK_RE.finditer(text):
+            count += 1
+            if count >= threshold:
+                return True
+        return False
     
     def get_stats(self) -> Dict:
         """Get translation statistics."""
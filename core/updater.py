@@ -8,15 +8,37 @@ Supports both source installations and compiled executables.
 import os
 import sys
 import json
+import time
+import hashlib
 import shutil
 import zipfile
 import tempfile
 import subprocess
+import queue
 import threading
+import collections
 import stat
+import concurrent.futures
 from pathlib import Path
 from typing import Optional, Tuple, Callable
 
+from core.http import get_session
+
+try:
+    # orjson parses straight from response bytes and serializes to bytes
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# The only release fields the update check reads
+_RELEASE_FIELDS = ('tag_name', 'body', 'html_url')
+
 # Current version - UPDATE THIS WITH EACH RELEASE
 __version__ = "2.0.0"
 
@@ -25,6 +47,11 @@ GITHUB_REPO = "joelsnl/novelDownloader"
 GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 GITHUB_DOWNLOAD_URL = f"https://github.com/{GITHUB_REPO}/archive/refs/heads/main.zip"
 
+# Last releases/latest response, revalidated with If-None-Match
+RELEASE_CACHE_FILE = "update_cache.json"
+# How long the startup check trusts the cached release without asking GitHub
+RELEASE_CACHE_MAX_AGE = 3600
+
 
 def get_current_version() -> str:
     """Get the current application version."""
@@ -44,6 +71,21 @@ def get_app_dir() -> Path:
         return Path(os.path.dirname(os.path.abspath(__file__))).parent
 
 
+def get_cache_dir() -> Path:
+    """
+    Per-user cache directory (chapters, covers, translations).
+    Not under the app directory: a --onefile build runs from a temp
+    folder that is deleted on exit.
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or str(Path.home() / 'AppData' / 'Local')
+    elif sys.platform == 'darwin':
+        base = str(Path.home() / 'Library' / 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(base) / 'novelDownloader'
+
+
 def get_executable_path() -> Optional[Path]:
     """Get the path to the current executable (if frozen)."""
     if is_frozen():
@@ -51,39 +93,122 @@ def get_executable_path() -> Optional[Path]:
     return None
 
 
-def check_for_updates(callback: Optional[Callable[[bool, str, str], None]] = None) -> Tuple[bool, str, str]:
+def _parse_version(v: str) -> Optional[Tuple[int, ...]]:
+    """Parse a plain dotted version ('v2.1.0') to an int tuple, or None."""
+    parts = v.strip().lstrip('v').split('.')
+    if not all(part.isdigit() for part in parts):
+        return None
+    numbers = [int(part) for part in parts]
+    # 2.0 == 2.0.0
+    while len(numbers) > 1 and numbers[-1] == 0:
+        numbers.pop()
+    return tuple(numbers)
+
+
+def _is_newer(latest: str, current: str) -> bool:
+    """
+    True if latest is a newer version than current. Plain dotted versions
+    compare as int tuples; anything else (pre-release suffixes) goes
+    through packaging if it's installed.
+    """
+    latest_parts, current_parts = _parse_version(latest), _parse_version(current)
+    if latest_parts is not None and current_parts is not None:
+        return latest_parts > current_parts
+    try:
+        from packaging import version
+        return version.parse(latest) > version.parse(current)
+    except Exception:
+        # Simple string comparison fallback
+        return latest != current
+
+
+def _write_json(path: Path, obj):
+    """
+    Write compact JSON atomically: to a temp file, then os.replace over
+    the target, so a crash mid-write can't leave a truncated file.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(_json_dumps(obj))
+    os.replace(tmp_path, path)
+
+
+def _load_release_cache() -> dict:
+    """Load the cached releases/latest response ({} if there is none)."""
+    try:
+        with open(get_app_dir() / RELEASE_CACHE_FILE, 'rb') as f:
+            cache = _json_loads(f.read())
+        return cache if isinstance(cache, dict) and 'release' in cache else {}
+    except Exception:
+        return {}
+
+
+def _save_release_cache(etag: Optional[str], release_data: dict):
+    """Remember a releases/latest response and its ETag."""
+    try:
+        _write_json(get_app_dir() / RELEASE_CACHE_FILE,
+                    {'etag': etag, 'release': release_data, 'cached_at': time.time()})
+    except Exception:
+        pass
+
+
+def _fetch_latest_release(session, max_age: float) -> Optional[dict]:
+    """
+    Get the latest release info, or None if the repo has no releases.
+    A cached copy younger than max_age is used as-is; otherwise GitHub is
+    asked with If-None-Match, and a 304 reuses the cached copy (304s
+    don't count against the API rate limit).
+    """
+    cache = _load_release_cache()
+    if cache and time.time() - cache.get('cached_at', 0) < max_age:
+        return cache['release']
+    
+    # A conditional GET already answers "unchanged" with a bodiless 304 in
+    # one round trip; a HEAD first would only add a request on changes
+    headers = {'Accept': 'application/vnd.github.v3+json'}
+    if cache.get('etag'):
+        headers['If-None-Match'] = cache['etag']
+    response = session.get(GITHUB_API_URL, timeout=15, headers=headers)
+    
+    if response.status_code == 304 and cache:
+        _save_release_cache(cache.get('etag'), cache['release'])
+        return cache['release']
+    
+    if response.status_code == 404:
+        return None
+    
+    response.raise_for_status()
+    # Keep just the fields we use; the full release (assets etc.) is tens of KB
+    release = _json_loads(response.content)
+    release_data = {key: release[key] for key in _RELEASE_FIELDS if key in release}
+    _save_release_cache(response.headers.get('ETag'), release_data)
+    return release_data
+
+
+def check_for_updates(
+    callback: Optional[Callable[[bool, str, str], None]] = None,
+    max_age: float = 0
+) -> Tuple[bool, str, str]:
     """
     Check GitHub for updates.
     
     Args:
         callback: Optional callback(has_update, latest_version, message) for async use
+        max_age: Seconds a cached release check may be reused without a request
         
     Returns:
         Tuple of (has_update: bool, latest_version: str, message: str)
     """
     try:
-        # Import here to avoid circular imports
-        try:
-            from curl_cffi.requests import Session
-            session = Session(impersonate="chrome120")
-        except ImportError:
-            import requests
-            session = requests.Session()
-            session.headers.update({
-                'User-Agent': 'NovelDownloader-Updater/1.0',
-                'Accept': 'application/vnd.github.v3+json'
-            })
+        # Shared pooled session, so repeat checks reuse the TLS connection
+        session = get_session()
         
-        # Fetch latest release info from GitHub API
-        response = session.get(GITHUB_API_URL, timeout=15)
+        # Fetch latest release info from GitHub API (or the cache)
+        release_data = _fetch_latest_release(session, max_age)
         
-        if response.status_code == 404:
+        if release_data is None:
             # No releases yet, check if repo exists
             return (False, __version__, "No releases found. You may be on the latest development version.")
         
-        response.raise_for_status()
-        release_data = response.json()
-        
         # Get latest version (remove 'v' prefix if present)
         latest_version = release_data.get('tag_name', '').lstrip('v')
         release_notes = release_data.get('body', 'No release notes available.')
@@ -93,12 +218,7 @@ def check_for_updates(callback: Optional[Callable[[bool, str, str], None]] = Non
             return (False, __version__, "Could not determine latest version.")
         
         # Compare versions
-        try:
-            from packaging import version
-            has_update = version.parse(latest_version) > version.parse(__version__)
-        except Exception:
-            # Simple string comparison fallback
-            has_update = latest_version != __version__
+        has_update = _is_newer(latest_version, __version__)
         
         if has_update:
             message = f"New version {latest_version} available!\n\nRelease notes:\n{release_notes[:500]}..."
@@ -118,13 +238,27 @@ def check_for_updates(callback: Optional[Callable[[bool, str, str], None]] = Non
         return (False, __version__, message)
 
 
+# Interpreter found by _find_python(), remembered for the process lifetime
+_python_cmd: Optional[str] = None
+
+
 def _find_python() -> Optional[str]:
     """Find a Python interpreter that can run the build script."""
+    global _python_cmd
+    # From source, the interpreter we're running in will do
+    if not is_frozen() and sys.executable:
+        return sys.executable
+    if _python_cmd is not None:
+        return _python_cmd
+    
     _creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
     # Try common Python commands
     python_commands = ['python3', 'python', 'py']
     
     for cmd in python_commands:
+        # PATH lookup is a few stat() calls; only launch commands that exist
+        if shutil.which(cmd) is None:
+            continue
         try:
             result = subprocess.run(
                 [cmd, '--version'],
@@ -134,6 +268,7 @@ def _find_python() -> Optional[str]:
                 creationflags=_creationflags
             )
             if result.returncode == 0 and 'Python 3' in result.stdout:
+                _python_cmd = cmd
                 return cmd
         except Exception:
             continue
@@ -143,13 +278,13 @@ def _find_python() -> Optional[str]:
 
 def _create_replacement_script(new_exe: Path, old_exe: Path, app_dir: Path) -> Path:
     """
-    Create a script that will replace the old executable with the new one.
-    This script runs after the main app closes.
+    Create a Windows batch script that will replace the old executable
+    with the new one. This script runs after the main app closes.
+    (Unix needs no helper; see _update_frozen_app.)
     """
-    if sys.platform == 'win32':
-        # Windows batch script
-        script_path = app_dir / '_update_helper.bat'
-        script_content = f'''@echo off
+    # Windows batch script
+    script_path = app_dir / '_update_helper.bat'
+    script_content = f'''@echo off
 echo Waiting for application to close...
 timeout /t 2 /nobreak > nul
 
@@ -167,39 +302,153 @@ move /y "{new_exe}" "{old_exe}"
 echo Cleaning up...
 del /f "{app_dir / '_update_backup.exe'}" 2>nul
 (goto) 2>nul & del "%~f0"
-'''
-    else:
-        # Unix shell script (macOS/Linux)
-        script_path = app_dir / '_update_helper.sh'
-        script_content = f'''#!/bin/bash
-echo "Waiting for application to close..."
-sleep 2
-
-# Wait for the old process to finish
-while pgrep -f "{old_exe.name}" > /dev/null 2>&1; do
-    sleep 1
-done
-
-echo "Replacing executable..."
-rm -f "{old_exe}"
-mv "{new_exe}" "{old_exe}"
-chmod +x "{old_exe}"
-
-echo "Cleaning up..."
-rm -f "{app_dir / '_update_backup'}"
-rm -f "$0"
 '''
     
     with open(script_path, 'w') as f:
         f.write(script_content)
     
-    # Make shell script executable on Unix
-    if sys.platform != 'win32':
-        os.chmod(script_path, os.stat(script_path).st_mode | stat.S_IEXEC)
-    
     return script_path
 
 
+# Chunk and write-buffer size for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+# Source-install archives up to this size never touch the disk
+SPOOL_MAX_BYTES = 32 * 1024 * 1024
+
+
+def _download_to_file(
+    session,
+    url: str,
+    out,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    expected_sha256: Optional[str] = None,
+    etag: Optional[str] = None
+) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Stream a download in chunks into the binary file object `out` instead
+    of holding it in memory. Reports progress between 10% and 30% when
+    the size is known.
+    
+    Returns (hex SHA-256, response ETag). The hash is computed while the
+    chunks pass through (no second read of the file); with
+    expected_sha256 a mismatch raises ValueError. With etag the request
+    is conditional, and None is returned if the server says the file is
+    unchanged (304).
+    """
+    digest = hashlib.sha256()
+    headers = {'If-None-Match': etag} if etag else {}
+    response = session.get(url, timeout=120, stream=True, headers=headers)
+    try:
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        total = int(response.headers.get('Content-Length') or 0)
+        received = 0
+        shown = 10
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            out.write(chunk)
+            received += len(chunk)
+            if progress_callback and total:
+                percent = 10 + 20 * min(received, total) // total
+                if percent > shown:
+                    shown = percent
+                    progress_callback(percent, 100, f"Downloading update... {received >> 20} MB")
+    finally:
+        response.close()
+    
+    sha256 = digest.hexdigest()
+    if expected_sha256 and sha256 != expected_sha256.lower():
+        raise ValueError(f"Downloaded file is corrupt (SHA-256 {sha256}, expected {expected_sha256})")
+    return sha256, response.headers.get('ETag')
+
+
+def _is_plain_member(name: str) -> bool:
+    """True if an archive member path stays inside the extraction folder."""
+    return not os.path.isabs(name) and '..' not in name.split('/') and ':' not in name and '\\' not in name
+
+
+def _copy_member(zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path):
+    """Stream one archive member to target in DOWNLOAD_CHUNK_SIZE blocks."""
+    with zip_ref.open(info) as src, open(target, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as out:
+        shutil.copyfileobj(src, out, DOWNLOAD_CHUNK_SIZE)
+
+
+def _archive_root(zip_ref: zipfile.ZipFile) -> Optional[str]:
+    """
+    Top-level folder every member sits under (usually novelDownloader-main),
+    read from the first entry name; None if the archive has none.
+    """
+    names = zip_ref.namelist()
+    if not names or '/' not in names[0]:
+        return None
+    root = names[0].split('/', 1)[0]
+    return root if root and _is_plain_member(root) else None
+
+
+def _extract_zip(zip_path: Path, dest: Path) -> Optional[str]:
+    """
+    Extract an archive with a few threads. Each thread reads through its
+    own ZipFile handle (one handle isn't thread-safe); directories are
+    created up front so workers never race to create the same one.
+    Returns the archive's top-level folder (see _archive_root).
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        root = _archive_root(zip_ref)
+        files = []
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                zip_ref.extract(info, dest)
+            else:
+                files.append(info)
+                parent = os.path.dirname(info.filename)
+                if parent and _is_plain_member(parent):
+                    os.makedirs(dest / parent, exist_ok=True)
+    
+    handles = threading.local()
+    opened = []
+    opened_lock = threading.Lock()
+    
+    def extract_one(info):
+        zip_ref = getattr(handles, 'zip_ref', None)
+        if zip_ref is None:
+            zip_ref = handles.zip_ref = zipfile.ZipFile(zip_path, 'r')
+            with opened_lock:
+                opened.append(zip_ref)
+        if _is_plain_member(info.filename):
+            _copy_member(zip_ref, info, dest / info.filename)
+        else:
+            zip_ref.extract(info, dest)  # Sanitizes odd paths
+    
+    workers = min(8, os.cpu_count() or 1)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            # list() re-raises the first extraction error
+            list(executor.map(extract_one, files))
+    finally:
+        for zip_ref in opened:
+            zip_ref.close()
+    
+    return root
+
+
+def _already_installed(
+    progress_callback: Optional[Callable[[int, int, str], None]] = None
+) -> Tuple[bool, str]:
+    """Result for an update whose archive matches the one already installed."""
+    if progress_callback:
+        progress_callback(100, 100, "Already up to date")
+    return (True, "The latest version is already installed.")
+
+
+def _remember_installed(result: Tuple[bool, str], archive_etag: Optional[str]):
+    """Record the installed archive's ETag after a successful update."""
+    if result[0] and archive_etag:
+        settings = load_settings()
+        settings['installed_archive_etag'] = archive_etag
+        save_settings(settings)
+
+
 def download_update(
     progress_callback: Optional[Callable[[int, int, str], None]] = None
 ) -> Tuple[bool, str]:
@@ -219,52 +468,71 @@ def download_update(
         if progress_callback:
             progress_callback(0, 100, "Connecting to GitHub...")
         
-        # Import session
-        try:
-            from curl_cffi.requests import Session
-            session = Session(impersonate="chrome120")
-        except ImportError:
-            import requests
-            session = requests.Session()
-            session.headers.update({'User-Agent': 'NovelDownloader-Updater/1.0'})
+        session = get_session()
         
-        # Download the zip file
-        if progress_callback:
-            progress_callback(10, 100, "Downloading update...")
+        app_dir = get_app_dir()
         
-        response = session.get(GITHUB_DOWNLOAD_URL, timeout=120)
-        response.raise_for_status()
+        # ETag of the archive last installed; an unchanged archive comes
+        # back as a bodiless 304 instead of being downloaded again
+        installed_etag = load_settings().get('installed_archive_etag')
         
         if progress_callback:
-            progress_callback(30, 100, "Extracting files...")
+            progress_callback(10, 100, "Downloading update...")
         
-        app_dir = get_app_dir()
+        # Source installs only need a few members, written straight into
+        # place; the archive stays in memory unless it's unusually large.
+        # (A zip can't be read before its central directory, at the very
+        # end, has arrived, so there's nothing to overlap with the download.)
+        if not is_frozen():
+            with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as spooled:
+                downloaded = _download_to_file(
+                    session, GITHUB_DOWNLOAD_URL, spooled, progress_callback, etag=installed_etag
+                )
+                if downloaded is None:
+                    return _already_installed(progress_callback)
+                sha256, archive_etag = downloaded
+                print(f"Update archive SHA-256: {sha256}")
+                
+                if progress_callback:
+                    progress_callback(30, 100, "Extracting files...")
+                
+                spooled.seek(0)
+                with zipfile.ZipFile(spooled, 'r') as zip_ref:
+                    result = _update_source_app(zip_ref, app_dir, progress_callback)
+                _remember_installed(result, archive_etag)
+                return result
         
         # Create temp directory for extraction
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
             zip_path = temp_path / "update.zip"
             
-            # Write downloaded content
-            with open(zip_path, 'wb') as f:
-                f.write(response.content)
+            # Download the zip file straight to disk
+            with open(zip_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                downloaded = _download_to_file(
+                    session, GITHUB_DOWNLOAD_URL, f, progress_callback, etag=installed_etag
+                )
+            if downloaded is None:
+                return _already_installed(progress_callback)
+            sha256, archive_etag = downloaded
+            print(f"Update archive SHA-256: {sha256}")
+            
+            if progress_callback:
+                progress_callback(30, 100, "Extracting files...")
             
             # Extract zip
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_path)
+            root = _extract_zip(zip_path, temp_path)
             
-            # Find the extracted directory (usually novelDownloader-main)
-            extracted_dirs = [d for d in temp_path.iterdir() if d.is_dir()]
-            if not extracted_dirs:
+            # The extracted directory (usually novelDownloader-main), known
+            # from the archive's entry names
+            extracted_dir = temp_path / root if root else None
+            if extracted_dir is None or not extracted_dir.is_dir():
                 return (False, "Failed to extract update - no directory found")
             
-            extracted_dir = extracted_dirs[0]
-            
-            # Check if we're running as a compiled executable
-            if is_frozen():
-                return _update_frozen_app(extracted_dir, app_dir, progress_callback)
-            else:
-                return _update_source_app(extracted_dir, app_dir, progress_callback)
+            # Compiled executable: rebuild from the extracted source
+            result = _update_frozen_app(extracted_dir, app_dir, progress_callback)
+            _remember_installed(result, archive_etag)
+            return result
             
     except Exception as e:
         import traceback
@@ -273,17 +541,35 @@ def download_update(
 
 
 def _update_source_app(
-    extracted_dir: Path, 
+    zip_ref: zipfile.ZipFile,
     app_dir: Path,
     progress_callback: Optional[Callable[[int, int, str], None]] = None
 ) -> Tuple[bool, str]:
-    """Update a source (non-compiled) installation."""
+    """
+    Update a source (non-compiled) installation by writing the updated
+    members of the downloaded archive straight into app_dir.
+    """
     if progress_callback:
         progress_callback(50, 100, "Installing update...")
     
     # Files/folders to update
     items_to_update = ['app.py', 'core', 'parsers']
     
+    # Members sit under one top-level folder (usually novelDownloader-main/)
+    root = _archive_root(zip_ref)
+    if root is None:
+        return (False, "Failed to extract update - no directory found")
+    prefix = root + '/'
+    
+    members: dict = {item: [] for item in items_to_update}
+    for info in zip_ref.infolist():
+        if info.is_dir() or not info.filename.startswith(prefix):
+            continue
+        rel = info.filename[len(prefix):]
+        parts = rel.split('/')
+        if parts[0] in members and _is_plain_member(rel):
+            members[parts[0]].append((rel, info))
+    
     # Create backup
     backup_dir = app_dir / '.update_backup'
     if backup_dir.exists():
@@ -291,30 +577,26 @@ def _update_source_app(
     backup_dir.mkdir(exist_ok=True)
     
     for item in items_to_update:
-        src = extracted_dir / item
-        dst = app_dir / item
-        
-        if not src.exists():
+        if not members[item]:
             continue
         
-        # Backup existing
+        # Move the existing version into the backup: one rename(2) on the
+        # same filesystem; shutil.move copies if the backup dir is elsewhere
+        dst = app_dir / item
         if dst.exists():
-            backup_dst = backup_dir / item
-            if dst.is_dir():
-                shutil.copytree(dst, backup_dst)
-            else:
-                shutil.copy2(dst, backup_dst)
+            try:
+                os.replace(dst, backup_dir / item)
+            except OSError:
+                shutil.move(str(dst), str(backup_dir / item))
         
         if progress_callback:
             progress_callback(60, 100, f"Updating {item}...")
         
-        # Copy new version
-        if src.is_dir():
-            if dst.exists():
-                shutil.rmtree(dst)
-            shutil.copytree(src, dst)
-        else:
-            shutil.copy2(src, dst)
+        # Write the new version
+        for rel, info in members[item]:
+            target = app_dir / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            _copy_member(zip_ref, info, target)
     
     if progress_callback:
         progress_callback(100, 100, "Update complete!")
@@ -360,7 +642,8 @@ def _update_frozen_app(
         try:
             subprocess.run(
                 [python_cmd, '-m', 'pip', 'install', '-r', str(requirements_file), '-q'],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=120,
                 creationflags=_creationflags
             )
@@ -371,7 +654,8 @@ def _update_frozen_app(
     try:
         subprocess.run(
             [python_cmd, '-m', 'pip', 'install', 'pyinstaller', '-q'],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=60,
             creationflags=_creationflags
         )
@@ -383,21 +667,41 @@ def _update_frozen_app(
         progress_callback(50, 100, "Building new executable (this may take a while)...")
     
     try:
-        result = subprocess.run(
+        # Keep only the last lines of PyInstaller's (very long) log; the
+        # error is at the end
+        tail = collections.deque(maxlen=200)
+        process = subprocess.Popen(
             [python_cmd, str(build_script)],
             cwd=str(extracted_dir),
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=600,  # 10 minute timeout for build
             creationflags=_creationflags
         )
         
-        if result.returncode != 0:
-            error_msg = result.stderr or result.stdout or "Unknown build error"
-            return (False, f"Build failed:\n{error_msg[:500]}")
+        # 10 minute timeout for build
+        timed_out = threading.Event()
+        
+        def kill_build():
+            timed_out.set()
+            process.kill()
+        
+        timer = threading.Timer(600, kill_build)
+        timer.start()
+        try:
+            for line in process.stdout:
+                tail.append(line)
+            returncode = process.wait()
+        finally:
+            timer.cancel()
+        
+        if timed_out.is_set():
+            return (False, "Build timed out after 10 minutes.")
+        
+        if returncode != 0:
+            error_msg = ''.join(tail).strip() or "Unknown build error"
+            return (False, f"Build failed:\n{error_msg[-500:]}")
         
-    except subprocess.TimeoutExpired:
-        return (False, "Build timed out after 10 minutes.")
     except Exception as e:
         return (False, f"Build failed: {str(e)}")
     
@@ -436,12 +740,10 @@ def _update_frozen_app(
     temp_new_exe = app_dir / f'_new_{new_exe_name}'
     shutil.copy2(new_exe, temp_new_exe)
     
-    # Create the replacement script
-    script_path = _create_replacement_script(temp_new_exe, old_exe, app_dir)
-    
-    # Launch the replacement script
     if sys.platform == 'win32':
-        # On Windows, launch the batch script without a visible console window
+        # A running .exe can't be replaced on Windows, so a batch script
+        # swaps it in once we've exited; launched without a console window
+        script_path = _create_replacement_script(temp_new_exe, old_exe, app_dir)
         subprocess.Popen(
             ['cmd', '/c', str(script_path)],
             creationflags=subprocess.CREATE_NO_WINDOW,
@@ -449,13 +751,12 @@ def _update_frozen_app(
             stderr=subprocess.DEVNULL
         )
     else:
-        # On Unix, run in background
-        subprocess.Popen(
-            ['/bin/bash', str(script_path)],
-            start_new_session=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
+        # On Unix, renaming over a running executable is safe: this process
+        # keeps the old inode open until it exits. Swap it in directly
+        # instead of spawning a shell to wait for us.
+        os.replace(temp_new_exe, old_exe)
+        os.chmod(old_exe, os.stat(old_exe).st_mode | stat.S_IEXEC)
+        (app_dir / '_update_backup').unlink(missing_ok=True)
     
     if progress_callback:
         progress_callback(100, 100, "Update ready!")
@@ -467,16 +768,43 @@ def _update_frozen_app(
     )
 
 
-def check_for_updates_async(callback: Callable[[bool, str, str], None]):
+# One long-lived daemon thread runs every background update task in turn,
+# instead of a new thread per check/download
+_tasks: "queue.Queue[Tuple[Callable, tuple]]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+
+
+def _task_worker():
+    """Run queued update tasks forever (daemon, so it never blocks exit)."""
+    while True:
+        func, args = _tasks.get()
+        try:
+            func(*args)
+        except Exception:
+            import traceback
+            traceback.print_exc()
+
+
+def _run_in_background(func: Callable, *args):
+    """Queue func(*args) on the updater's background thread, starting it if needed."""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_task_worker, name="updater", daemon=True)
+            _worker.start()
+    _tasks.put((func, args))
+
+
+def check_for_updates_async(callback: Callable[[bool, str, str], None], max_age: float = 0):
     """
     Check for updates in a background thread.
     
     Args:
         callback: Callback function(has_update, latest_version, message)
+        max_age: Seconds a cached release check may be reused without a request
     """
-    thread = threading.Thread(target=check_for_updates, args=(callback,))
-    thread.daemon = True
-    thread.start()
+    _run_in_background(check_for_updates, callback, max_age)
 
 
 def download_update_async(
@@ -495,9 +823,7 @@ def download_update_async(
         if completion_callback:
             completion_callback(success, message)
     
-    thread = threading.Thread(target=_download)
-    thread.daemon = True
-    thread.start()
+    _run_in_background(_download)
 
 
 # Settings management for auto-update preference
@@ -509,13 +835,34 @@ def get_settings_path() -> Path:
     return get_app_dir() / SETTINGS_FILE
 
 
+# Parsed settings keyed by the file's (mtime_ns, size), so repeated reads
+# skip json parsing
+_settings_cache: Optional[Tuple[Tuple[int, int], dict]] = None
+
+
+def _settings_stamp(settings_path: Path) -> Tuple[int, int]:
+    """Change stamp of the settings file; raises OSError if it's missing."""
+    st = settings_path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
 def load_settings() -> dict:
     """Load updater settings."""
+    global _settings_cache
     settings_path = get_settings_path()
     try:
-        if settings_path.exists():
-            with open(settings_path, 'r') as f:
-                return json.load(f)
+        stamp = _settings_stamp(settings_path)
+    except OSError:
+        return {'auto_check_updates': True}
+    
+    if _settings_cache is not None and _settings_cache[0] == stamp:
+        return dict(_settings_cache[1])
+    
+    try:
+        with open(settings_path, 'rb') as f:
+            settings = _json_loads(f.read())
+        _settings_cache = (stamp, settings)
+        return dict(settings)
     except Exception:
         pass
     return {'auto_check_updates': True}
@@ -523,10 +870,12 @@ def load_settings() -> dict:
 
 def save_settings(settings: dict):
     """Save updater settings."""
+    global _settings_cache
     settings_path = get_settings_path()
     try:
-        with open(settings_path, 'w') as f:
-            json.dump(settings, f, indent=2)
+        _write_json(settings_path, settings)
+        # The next load_settings() can use what we just wrote
+        _settings_cache = (_settings_stamp(settings_path), dict(settings))
     except Exception:
         pass
 
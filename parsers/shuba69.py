@@ -7,12 +7,14 @@ Note: This site uses GB18030 encoding for text.
 """
 
 import re
-import time
 from typing import List, Optional, Tuple
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from lxml import etree
 
-from core.parser import BaseParser, Chapter, NovelInfo, register_parser
+from core.parser import (
+    BaseParser, Chapter, NovelInfo, FetchCancelled, register_parser,
+    has_class, first, node_text, outer_html, drop_all, parse_html_text
+)
 
 
 @register_parser
@@ -22,6 +24,26 @@ class Shuba69Parser(BaseParser):
     SITE_NAME = "69shuba.com"
     SITE_DOMAINS = ["69shuba.com", "69shu.com", "69shuba.cx", "69shu.pro", "69shuba.pro"]
     
+    # Precompiled XPath selectors
+    _X_TOC_LINK = etree.XPath(f"//a[{has_class('more-btn')}]")
+    _X_TITLE = etree.XPath(f"//div[{has_class('booknav2')}]//h1")
+    _X_NAV_LINKS = etree.XPath(f"//*[{has_class('booknav2')}]//a")
+    _X_COVER = etree.XPath(f"//div[{has_class('bookbox')}]//img")
+    _X_DESC = etree.XPath(f"//*[{has_class('navtxt')}]//p | //*[{has_class('bookintro')}]")
+    _X_CATEGORY = etree.XPath(f"//*[{has_class('booknav2')}]//a[contains(@href, 'sort')]")
+    _X_MENU = etree.XPath("//*[@id='catalog']//ul")
+    _X_MENU_FALLBACK = etree.XPath(
+        f"//*[{has_class('catalog')}]//ul | //*[{has_class('mulu')}]//ul | //*[@id='list']//ul"
+    )
+    _X_MENU_LINKS = etree.XPath(".//a")
+    _X_CONTENT = etree.XPath(f"//div[{has_class('txtnav')}]")
+    _X_CHAPTER_TITLE = etree.XPath(f"//h1 | //*[{has_class('txtnav')}]//h1")
+    _X_JUNK = etree.XPath(
+        f".//*[{has_class('txtinfo')}] | .//*[@id='txtright'] | .//*[{has_class('bottom-ad')}]"
+        f" | .//script | .//*[{has_class('ads')}] | .//*[{has_class('ad')}]"
+        f" | .//ins[{has_class('adsbygoogle')}]"
+    )
+    
     def __init__(self):
         super().__init__()
         # Minimum delay between requests (site is sensitive to rapid requests)
@@ -64,7 +86,7 @@ class Shuba69Parser(BaseParser):
         match = re.search(r'/(?:book|txt)/(\d+)', url)
         return match.group(1) if match else None
     
-    def _fetch_with_encoding(self, url: str, referer: str = None, retries: int = 3) -> BeautifulSoup:
+    def _fetch_with_encoding(self, url: str, referer: str = None, retries: int = 3):
         """
         Fetch page with GB18030 encoding and proper headers.
         """
@@ -82,14 +104,14 @@ class Shuba69Parser(BaseParser):
             try:
                 # Add small delay between requests
                 if attempt > 0:
-                    time.sleep(self.request_delay)
+                    self._backoff(self.request_delay)
                 
                 response = self.session.get(url, timeout=30)
                 
                 if response.status_code == 429:
                     wait = self.rate_limit_delays[min(attempt, len(self.rate_limit_delays)-1)]
                     print(f"  Rate limited (429). Waiting {wait}s...")
-                    time.sleep(wait)
+                    self._backoff(wait)
                     continue
                 
                 if response.status_code == 403:
@@ -98,7 +120,7 @@ class Shuba69Parser(BaseParser):
                     book_id = self._extract_book_id(url)
                     if book_id:
                         self._set_referer(f"{self._base_url}/book/{book_id}/")
-                    time.sleep(2)
+                    self._backoff(2)
                     continue
                 
                 response.raise_for_status()
@@ -108,13 +130,15 @@ class Shuba69Parser(BaseParser):
                 
                 # Decode with GB18030 encoding
                 content = response.content.decode('gb18030', errors='replace')
-                return BeautifulSoup(content, 'lxml')
+                return parse_html_text(content)
                 
+            except FetchCancelled:
+                raise
             except Exception as e:
                 last_error = e
                 print(f"  Attempt {attempt + 1}/{retries} failed: {e}")
                 if attempt < retries - 1:
-                    time.sleep(2 ** (attempt + 1))
+                    self._backoff(2 ** (attempt + 1))
         
         raise last_error
     
@@ -129,11 +153,11 @@ class Shuba69Parser(BaseParser):
         
         # First get the main page to find TOC URL
         print(f"  Fetching main page...")
-        main_soup = self._fetch_with_encoding(url, referer=self._base_url)
+        main_tree = self._fetch_with_encoding(url, referer=self._base_url)
         
         # Find TOC URL (the "more" button)
-        toc_link = main_soup.select_one("a.more-btn")
-        if not toc_link:
+        toc_link = first(self._X_TOC_LINK(main_tree))
+        if toc_link is None:
             raise ValueError("Could not find chapter list link (a.more-btn)")
         
         toc_url = toc_link.get('href', '')
@@ -141,20 +165,20 @@ class Shuba69Parser(BaseParser):
             toc_url = urljoin(url, toc_url)
         
         print(f"  Fetching TOC from: {toc_url}")
-        toc_soup = self._fetch_with_encoding(toc_url, referer=url)
+        toc_tree = self._fetch_with_encoding(toc_url, referer=url)
         
         # Store TOC URL - this will be used as referer for chapter downloads
         self._last_page_url = toc_url
         
         # Parse novel info from main page
-        novel_info = self._parse_novel_info(main_soup, url)
+        novel_info = self._parse_novel_info(main_tree, url)
         
         # Parse chapter list from TOC page
-        chapters = self._parse_chapter_list(toc_soup, toc_url)
+        chapters = self._parse_chapter_list(toc_tree, toc_url)
         
         return novel_info, chapters
     
-    def _parse_novel_info(self, soup: BeautifulSoup, url: str) -> NovelInfo:
+    def _parse_novel_info(self, tree, url: str) -> NovelInfo:
         """Parse novel info from main page."""
         title = ""
         author = "Unknown"
@@ -163,31 +187,31 @@ class Shuba69Parser(BaseParser):
         tags = []
         
         # Title: div.booknav2 h1
-        title_el = soup.select_one("div.booknav2 h1")
-        if title_el:
-            title = title_el.get_text(strip=True)
+        title_el = first(self._X_TITLE(tree))
+        if title_el is not None:
+            title = node_text(title_el)
         
         # Author: second link in .booknav2
-        author_links = soup.select(".booknav2 a")
+        author_links = self._X_NAV_LINKS(tree)
         if len(author_links) >= 2:
-            author = author_links[1].get_text(strip=True)
+            author = node_text(author_links[1])
         
         # Cover image: first img in div.bookbox
-        cover_el = soup.select_one("div.bookbox img")
-        if cover_el:
+        cover_el = first(self._X_COVER(tree))
+        if cover_el is not None:
             cover_url = cover_el.get('src', '')
             if cover_url and not cover_url.startswith('http'):
                 cover_url = urljoin(url, cover_url)
         
         # Description: div.navtxt or similar
-        desc_el = soup.select_one(".navtxt p, .bookintro")
-        if desc_el:
-            description = desc_el.get_text(strip=True)
+        desc_el = first(self._X_DESC(tree))
+        if desc_el is not None:
+            description = node_text(desc_el)
         
         # Try to get category/tags
-        category_el = soup.select_one(".booknav2 a[href*='sort']")
-        if category_el:
-            tags.append(category_el.get_text(strip=True))
+        category_el = first(self._X_CATEGORY(tree))
+        if category_el is not None:
+            tags.append(node_text(category_el))
         
         return NovelInfo(
             title=title,
@@ -199,20 +223,20 @@ class Shuba69Parser(BaseParser):
             source_url=url
         )
     
-    def _parse_chapter_list(self, soup: BeautifulSoup, base_url: str) -> List[Chapter]:
+    def _parse_chapter_list(self, tree, base_url: str) -> List[Chapter]:
         """Parse chapter list from TOC page."""
         chapters = []
         
         # Chapter links are in #catalog ul
-        menu = soup.select_one("#catalog ul")
-        if not menu:
-            menu = soup.select_one(".catalog ul, .mulu ul, #list ul")
+        menu = first(self._X_MENU(tree))
+        if menu is None:
+            menu = first(self._X_MENU_FALLBACK(tree))
         
-        if not menu:
+        if menu is None:
             print("  Warning: Could not find chapter list container")
             return chapters
         
-        for idx, link in enumerate(menu.select("a")):
+        for idx, link in enumerate(self._X_MENU_LINKS(menu)):
             href = link.get('href', '')
             if not href:
                 continue
@@ -220,7 +244,7 @@ class Shuba69Parser(BaseParser):
             if not href.startswith('http'):
                 href = urljoin(base_url, href)
             
-            title = link.get_text(strip=True)
+            title = node_text(link)
             if not title:
                 continue
             
@@ -244,8 +268,8 @@ class Shuba69Parser(BaseParser):
         """Extract novel metadata from main page."""
         self._base_url = '/'.join(url.split('/')[:3])
         self._setup_session_headers()
-        soup = self._fetch_with_encoding(url)
-        return self._parse_novel_info(soup, url)
+        tree = self._fetch_with_encoding(url)
+        return self._parse_novel_info(tree, url)
     
     def get_chapter_list(self, url: str) -> List[Chapter]:
         """Get full chapter list."""
@@ -253,10 +277,10 @@ class Shuba69Parser(BaseParser):
         self._setup_session_headers()
         
         print(f"  Fetching main page...")
-        main_soup = self._fetch_with_encoding(url)
+        main_tree = self._fetch_with_encoding(url)
         
-        toc_link = main_soup.select_one("a.more-btn")
-        if not toc_link:
+        toc_link = first(self._X_TOC_LINK(main_tree))
+        if toc_link is None:
             raise ValueError("Could not find chapter list link")
         
         toc_url = toc_link.get('href', '')
@@ -264,10 +288,10 @@ class Shuba69Parser(BaseParser):
             toc_url = urljoin(url, toc_url)
         
         print(f"  Fetching TOC from: {toc_url}")
-        toc_soup = self._fetch_with_encoding(toc_url, referer=url)
+        toc_tree = self._fetch_with_encoding(toc_url, referer=url)
         self._last_page_url = toc_url
         
-        return self._parse_chapter_list(toc_soup, toc_url)
+        return self._parse_chapter_list(toc_tree, toc_url)
     
     def get_chapter_content(self, chapter: Chapter) -> str:
         """Fetch and extract content for a single chapter."""
@@ -281,28 +305,25 @@ class Shuba69Parser(BaseParser):
             else:
                 referer = self._base_url
         
-        # Small delay between chapter fetches
-        time.sleep(self.request_delay)
+        # No sleep here: callers pace chapter requests with a RateLimiter
+        # at request_delay, so a sleep would only add latency per chapter
         
-        soup = self._fetch_with_encoding(chapter.url, referer=referer)
+        tree = self._fetch_with_encoding(chapter.url, referer=referer)
         
         # Content is in div.txtnav
-        content_el = soup.select_one("div.txtnav")
-        if not content_el:
+        content_el = first(self._X_CONTENT(tree))
+        if content_el is None:
             return f"<p>Failed to extract content from {chapter.url}</p>"
         
         # Remove unwanted elements
-        for selector in ['.txtinfo', '#txtright', '.bottom-ad', 'script', 
-                         '.ads', '.ad', 'ins.adsbygoogle']:
-            for el in content_el.select(selector):
-                el.decompose()
+        drop_all(self._X_JUNK(content_el))
         
         # Get chapter title from page
-        title_el = soup.select_one("h1, .txtnav h1")
-        chapter_title = title_el.get_text(strip=True) if title_el else chapter.title
+        title_el = first(self._X_CHAPTER_TITLE(tree))
+        chapter_title = node_text(title_el) if title_el is not None else chapter.title
         
         # Build HTML content
         html = f"<h1>{chapter_title}</h1>\n"
-        html += str(content_el)
+        html += outer_html(content_el)
         
         return html
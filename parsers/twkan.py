@@ -8,9 +8,12 @@ import re
 import time
 import concurrent.futures
 from typing import List, Optional, Tuple
-from bs4 import BeautifulSoup
+from lxml import etree
 
-from core.parser import BaseParser, Chapter, NovelInfo, register_parser
+from core.parser import (
+    BaseParser, Chapter, NovelInfo, register_parser,
+    has_class, first, node_text, outer_html, drop_all
+)
 
 
 @register_parser
@@ -20,12 +23,31 @@ class TwkanParser(BaseParser):
     SITE_NAME = "twkan.com"
     SITE_DOMAINS = ["twkan.com"]
     
+    # Precompiled XPath selectors
+    _X_META = etree.XPath("//meta[@property=$prop]/@content")
+    _X_TITLE = etree.XPath(
+        f"//*[{has_class('booknav2')}]//h1/a | //*[{has_class('booknav2')}]//h1 | //h1"
+    )
+    _X_AUTHOR = etree.XPath(f"//*[{has_class('booknav2')}]//p//a[contains(@href, '/author/')]")
+    _X_DESC = etree.XPath(f"//*[{has_class('navtxt')}]//p")
+    _X_COVER = etree.XPath(
+        f"//*[{has_class('bookimg2')}]//img/@src | //*[{has_class('bookimg')}]//img/@src"
+    )
+    _X_CHAPTER_LINKS = etree.XPath("//ul//li//a")
+    _X_CONTENT = etree.XPath("//*[@id='txtcontent0']")
+    _X_CHAPTER_TITLE = etree.XPath(f"//*[{has_class('txtnav')}]//h1 | //h1")
+    _X_JUNK = etree.XPath(
+        f".//script | .//*[{has_class('ads')}] | .//*[{has_class('ad')}]"
+        f" | .//*[{has_class('txtad')}] | .//*[{has_class('txtcenter')}]"
+        f" | .//ins[{has_class('adsbygoogle')}] | .//*[{has_class('advertisement')}]"
+    )
+    
     def __init__(self):
         super().__init__()
         # Higher delay to avoid 429 errors (like WebToEpub does for strict sites)
         self.request_delay = 3.0  # 3 seconds between requests
         # Cache for parallel fetching
-        self._cached_soup = None
+        self._cached_tree = None
         self._cached_url = None
     
     def _extract_book_id(self, url: str) -> Optional[str]:
@@ -49,16 +71,16 @@ class TwkanParser(BaseParser):
         ajax_url = f"https://twkan.com/ajax_novels/chapterlist/{book_id}.html"
         
         # Fetch both pages in parallel
-        main_soup = None
-        ajax_html = None
+        main_tree = None
+        ajax_tree = None
         
         def fetch_main():
-            nonlocal main_soup
-            main_soup = self.fetch_page(url)
+            nonlocal main_tree
+            main_tree = self.fetch_tree(url)
         
         def fetch_ajax():
-            nonlocal ajax_html
-            ajax_html = self.fetch_html(ajax_url)
+            nonlocal ajax_tree
+            ajax_tree = self.fetch_tree(ajax_url)
         
         print(f"  Fetching main page and chapter list in parallel...")
         with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
@@ -77,15 +99,15 @@ class TwkanParser(BaseParser):
         print(f"  Both fetches complete, parsing...")
         
         # Parse novel info from main page
-        novel_info = self._parse_novel_info(main_soup, url)
+        novel_info = self._parse_novel_info(main_tree, url)
         
         # Parse chapter list from AJAX response
-        chapters = self._parse_chapter_list(ajax_html)
+        chapters = self._parse_chapter_list(ajax_tree)
         
         return novel_info, chapters
     
-    def _parse_novel_info(self, soup: BeautifulSoup, url: str) -> NovelInfo:
-        """Parse novel info from already-fetched soup."""
+    def _parse_novel_info(self, tree, url: str) -> NovelInfo:
+        """Parse novel info from an already-fetched page tree."""
         # Try meta tags first (most reliable)
         title = ""
         author = "Unknown"
@@ -94,45 +116,45 @@ class TwkanParser(BaseParser):
         tags = []
         
         # og:title
-        meta_title = soup.select_one("meta[property='og:title']")
-        if meta_title:
-            title = meta_title.get('content', '')
+        meta_title = first(self._X_META(tree, prop='og:title'))
+        if meta_title is not None:
+            title = str(meta_title)
         
         # Fallback: page title or h1
         if not title:
-            h1 = soup.select_one(".booknav2 h1 a, .booknav2 h1, h1")
-            if h1:
-                title = h1.get_text(strip=True)
+            h1 = first(self._X_TITLE(tree))
+            if h1 is not None:
+                title = node_text(h1)
         
         # og:novel:author
-        meta_author = soup.select_one("meta[property='og:novel:author']")
-        if meta_author:
-            author = meta_author.get('content', '')
+        meta_author = first(self._X_META(tree, prop='og:novel:author'))
+        if meta_author is not None:
+            author = str(meta_author)
         else:
             # Fallback: author link
-            author_el = soup.select_one(".booknav2 p a[href*='/author/']")
-            if author_el:
-                author = author_el.get_text(strip=True)
+            author_el = first(self._X_AUTHOR(tree))
+            if author_el is not None:
+                author = node_text(author_el)
         
         # og:description
-        meta_desc = soup.select_one("meta[property='og:description']")
-        if meta_desc:
-            description = meta_desc.get('content', '')
+        meta_desc = first(self._X_META(tree, prop='og:description'))
+        if meta_desc is not None:
+            description = str(meta_desc)
         else:
             # Fallback: navtxt
-            desc_el = soup.select_one(".navtxt p")
-            if desc_el:
-                description = desc_el.get_text(strip=True)
+            desc_el = first(self._X_DESC(tree))
+            if desc_el is not None:
+                description = node_text(desc_el)
         
         # og:image (cover)
-        meta_image = soup.select_one("meta[property='og:image']")
-        if meta_image:
-            cover_url = meta_image.get('content', '')
+        meta_image = first(self._X_META(tree, prop='og:image'))
+        if meta_image is not None:
+            cover_url = str(meta_image)
         else:
             # Fallback: book image
-            cover_el = soup.select_one(".bookimg2 img, .bookimg img")
-            if cover_el:
-                cover_url = cover_el.get('src', '')
+            cover_src = first(self._X_COVER(tree))
+            if cover_src is not None:
+                cover_url = str(cover_src)
         
         # If still no cover, try to construct from book ID
         if not cover_url:
@@ -142,9 +164,9 @@ class TwkanParser(BaseParser):
                 cover_url = f"https://twkan.com/files/article/image/{prefix}/{book_id}/{book_id}s.jpg"
         
         # Category/tags
-        meta_category = soup.select_one("meta[property='og:novel:category']")
-        if meta_category:
-            tags.append(meta_category.get('content', ''))
+        meta_category = first(self._X_META(tree, prop='og:novel:category'))
+        if meta_category is not None:
+            tags.append(str(meta_category))
         
         return NovelInfo(
             title=title,
@@ -156,12 +178,10 @@ class TwkanParser(BaseParser):
             source_url=url
         )
     
-    def _parse_chapter_list(self, html: str) -> List[Chapter]:
-        """Parse chapter list from AJAX HTML response."""
-        soup = BeautifulSoup(html, 'lxml')
-        
+    def _parse_chapter_list(self, tree) -> List[Chapter]:
+        """Parse chapter list from the AJAX response tree."""
         chapters = []
-        for idx, link in enumerate(soup.select("ul li a")):
+        for idx, link in enumerate(self._X_CHAPTER_LINKS(tree)):
             href = link.get('href', '')
             if '/txt/' not in href:
                 continue
@@ -170,7 +190,7 @@ class TwkanParser(BaseParser):
             if not href.startswith('http'):
                 href = f"https://twkan.com{href}"
             
-            title = link.get_text(strip=True)
+            title = node_text(link)
             
             chapters.append(Chapter(
                 title=title,
@@ -182,8 +202,8 @@ class TwkanParser(BaseParser):
     
     def get_novel_info(self, url: str) -> NovelInfo:
         """Extract novel metadata from main page."""
-        soup = self.fetch_page(url)
-        return self._parse_novel_info(soup, url)
+        tree = self.fetch_tree(url)
+        return self._parse_novel_info(tree, url)
     
     def get_chapter_list(self, url: str) -> List[Chapter]:
         """
@@ -194,39 +214,37 @@ class TwkanParser(BaseParser):
         if not book_id:
             raise ValueError(f"Could not extract book ID from URL: {url}")
         
-        # First visit the main page (sets cookies, passes any checks)
+        # First visit the main page (sets cookies, passes any checks);
+        # only the cookies matter, so skip decoding the body
         print(f"  Visiting main page first...")
-        self.fetch_page(url)
+        self._fetch_response(url)
         
         # Fetch full chapter list from AJAX endpoint
         ajax_url = f"https://twkan.com/ajax_novels/chapterlist/{book_id}.html"
         print(f"  Fetching chapters from: {ajax_url}")
         
-        html = self.fetch_html(ajax_url)
-        return self._parse_chapter_list(html)
+        tree = self.fetch_tree(ajax_url)
+        return self._parse_chapter_list(tree)
     
     def get_chapter_content(self, chapter: Chapter) -> str:
         """Fetch and extract content for a single chapter."""
-        soup = self.fetch_page(chapter.url)
+        tree = self.fetch_tree(chapter.url)
         
         # Content selector: #txtcontent0
-        content_el = soup.select_one("#txtcontent0")
-        if not content_el:
+        content_el = first(self._X_CONTENT(tree))
+        if content_el is None:
             return f"<p>Failed to extract content from {chapter.url}</p>"
         
         # Get chapter title
-        title_el = soup.select_one(".txtnav h1, #container .txtnav h1, h1")
-        chapter_title = title_el.get_text(strip=True) if title_el else chapter.title
+        title_el = first(self._X_CHAPTER_TITLE(tree))
+        chapter_title = node_text(title_el) if title_el is not None else chapter.title
         
         # Remove unwanted elements
-        for selector in ['script', '.ads', '.ad', '.txtad', '.txtcenter', 
-                         'ins.adsbygoogle', '.advertisement']:
-            for el in content_el.select(selector):
-                el.decompose()
+        drop_all(self._X_JUNK(content_el))
         
         # Build HTML content
         html = f"<h1>{chapter_title}</h1>\n"
-        html += str(content_el)
+        html += outer_html(content_el)
         
         return html
 
@@ -5,12 +5,14 @@ Traditional Chinese novel site with direct chapter listing on the main page.
 """
 
 import re
-import time
 from typing import List, Optional, Tuple
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from lxml import etree
 
-from core.parser import BaseParser, Chapter, NovelInfo, register_parser
+from core.parser import (
+    BaseParser, Chapter, NovelInfo, register_parser,
+    has_class, first, node_text, outer_html, drop_all
+)
 
 
 @register_parser
@@ -22,6 +24,33 @@ class UUKanshuParser(BaseParser):
 
     BASE_URL = "https://uukanshu.cc"
 
+    # Precompiled XPath selectors
+    _X_META = etree.XPath("//meta[@property=$prop]/@content")
+    _X_TITLE = etree.XPath(
+        f"//h1[{has_class('booktitle')}] | //*[{has_class('bookinfo')}]//h1 | //h1"
+    )
+    _X_AUTHOR = etree.XPath(
+        f"//*[{has_class('booktag')}]//a[{has_class('red')}][contains(@href, 'author')]"
+    )
+    _X_DESC = etree.XPath(f"//p[{has_class('bookintro')}]")
+    _X_COVER = etree.XPath(
+        f"//*[{has_class('bookcover')}]//img[{has_class('thumbnail')}]/@src"
+        f" | //*[{has_class('bookinfo')}]//img[{has_class('thumbnail')}]/@src"
+    )
+    _X_CHAPTER_LINKS = etree.XPath(f"//dl[{has_class('chapterlist')}]//dd//a")
+    _X_CHAPTER_LINKS_FALLBACK = etree.XPath("//*[@id='list-chapterAll']//dd//a")
+    _X_CONTENT = etree.XPath(f"//div[{has_class('readcotent')}]")
+    _X_CONTENT_FALLBACK = etree.XPath(
+        f"//div[{has_class('readcontent')}] | //div[{has_class('content')}] | //*[@id='bookContent']"
+    )
+    _X_CHAPTER_TITLE = etree.XPath(
+        f"//div[{has_class('read')}]//h1 | //h1[{has_class('pt10')}] | //h1"
+    )
+    _X_JUNK = etree.XPath(
+        f".//script | .//ins[{has_class('adsbygoogle')}] | .//*[{has_class('ads')}]"
+        f" | .//*[{has_class('ad')}] | .//iframe | .//div[contains(@style, 'text-align:center')]"
+    )
+
     def __init__(self):
         super().__init__()
         self.request_delay = 2.0
@@ -56,17 +85,17 @@ class UUKanshuParser(BaseParser):
 
         index_url = self._book_index_url(book_id)
         print(f"  Fetching book page: {index_url}")
-        soup = self.fetch_page(index_url)
+        tree = self.fetch_tree(index_url)
 
-        novel_info = self._parse_novel_info(soup, index_url)
-        chapters = self._parse_chapter_list(soup, book_id)
+        novel_info = self._parse_novel_info(tree, index_url)
+        chapters = self._parse_chapter_list(tree, book_id)
 
         return novel_info, chapters
 
     def get_novel_info(self, url: str) -> NovelInfo:
         """Extract novel metadata from the book index page."""
-        soup = self.fetch_page(url)
-        return self._parse_novel_info(soup, url)
+        tree = self.fetch_tree(url)
+        return self._parse_novel_info(tree, url)
 
     def get_chapter_list(self, url: str) -> List[Chapter]:
         """Get the full chapter list from the book index page."""
@@ -74,41 +103,38 @@ class UUKanshuParser(BaseParser):
         if not book_id:
             raise ValueError(f"Could not extract book ID from URL: {url}")
 
-        soup = self.fetch_page(url)
-        return self._parse_chapter_list(soup, book_id)
+        tree = self.fetch_tree(url)
+        return self._parse_chapter_list(tree, book_id)
 
     def get_chapter_content(self, chapter: Chapter) -> str:
         """Fetch and extract content for a single chapter."""
-        time.sleep(self.request_delay)
-        soup = self.fetch_page(chapter.url)
+        # Pacing (request_delay) is done by the caller's RateLimiter
+        tree = self.fetch_tree(chapter.url)
 
         # Content lives inside div.readcotent (note: site typo, not "readcontent")
-        content_el = soup.select_one("div.readcotent")
-        if not content_el:
+        content_el = first(self._X_CONTENT(tree))
+        if content_el is None:
             # Fallback selectors
-            content_el = soup.select_one("div.readcontent, div.content, #bookContent")
-        if not content_el:
+            content_el = first(self._X_CONTENT_FALLBACK(tree))
+        if content_el is None:
             return f"<p>Failed to extract content from {chapter.url}</p>"
 
         # Remove scripts, ads, and other junk
-        for selector in ['script', 'ins.adsbygoogle', '.ads', '.ad',
-                         'iframe', 'div[style*="text-align:center"]']:
-            for el in content_el.select(selector):
-                el.decompose()
+        drop_all(self._X_JUNK(content_el))
 
         # Chapter title from the page <h1>
-        title_el = soup.select_one("div.read h1, h1.pt10, h1")
-        chapter_title = title_el.get_text(strip=True) if title_el else chapter.title
+        title_el = first(self._X_CHAPTER_TITLE(tree))
+        chapter_title = node_text(title_el) if title_el is not None else chapter.title
 
         html = f"<h1>{chapter_title}</h1>\n"
-        html += str(content_el)
+        html += outer_html(content_el)
         return html
 
     # ------------------------------------------------------------------
     # Internal parsing helpers
     # ------------------------------------------------------------------
 
-    def _parse_novel_info(self, soup: BeautifulSoup, url: str) -> NovelInfo:
+    def _parse_novel_info(self, tree, url: str) -> NovelInfo:
         """Parse novel metadata from the book index page."""
         title = ""
         author = "Unknown"
@@ -117,49 +143,49 @@ class UUKanshuParser(BaseParser):
         tags = []
 
         # --- Title ---
-        meta_title = soup.select_one("meta[property='og:novel:book_name']")
-        if meta_title:
-            title = meta_title.get('content', '')
+        meta_title = first(self._X_META(tree, prop='og:novel:book_name'))
+        if meta_title is not None:
+            title = str(meta_title)
         if not title:
-            meta_title = soup.select_one("meta[property='og:title']")
-            if meta_title:
-                title = meta_title.get('content', '')
+            meta_title = first(self._X_META(tree, prop='og:title'))
+            if meta_title is not None:
+                title = str(meta_title)
         if not title:
-            h1 = soup.select_one("h1.booktitle, .bookinfo h1, h1")
-            if h1:
-                title = h1.get_text(strip=True)
+            h1 = first(self._X_TITLE(tree))
+            if h1 is not None:
+                title = node_text(h1)
 
         # --- Author ---
-        meta_author = soup.select_one("meta[property='og:novel:author']")
-        if meta_author:
-            author = meta_author.get('content', '')
+        meta_author = first(self._X_META(tree, prop='og:novel:author'))
+        if meta_author is not None:
+            author = str(meta_author)
         if not author or author == "Unknown":
-            author_el = soup.select_one(".booktag a.red[href*='author']")
-            if author_el:
-                author = author_el.get_text(strip=True)
+            author_el = first(self._X_AUTHOR(tree))
+            if author_el is not None:
+                author = node_text(author_el)
 
         # --- Description ---
-        meta_desc = soup.select_one("meta[property='og:description']")
-        if meta_desc:
-            description = meta_desc.get('content', '')
+        meta_desc = first(self._X_META(tree, prop='og:description'))
+        if meta_desc is not None:
+            description = str(meta_desc)
         if not description:
-            desc_el = soup.select_one("p.bookintro")
-            if desc_el:
-                description = desc_el.get_text(strip=True)
+            desc_el = first(self._X_DESC(tree))
+            if desc_el is not None:
+                description = node_text(desc_el)
 
         # --- Cover ---
-        meta_image = soup.select_one("meta[property='og:image']")
-        if meta_image:
-            cover_url = meta_image.get('content', '')
+        meta_image = first(self._X_META(tree, prop='og:image'))
+        if meta_image is not None:
+            cover_url = str(meta_image)
         if not cover_url:
-            cover_el = soup.select_one(".bookcover img.thumbnail, .bookinfo img.thumbnail")
-            if cover_el:
-                cover_url = cover_el.get('src', '')
+            cover_src = first(self._X_COVER(tree))
+            if cover_src is not None:
+                cover_url = str(cover_src)
 
         # --- Tags / Category ---
-        meta_cat = soup.select_one("meta[property='og:novel:category']")
-        if meta_cat:
-            cat = meta_cat.get('content', '')
+        meta_cat = first(self._X_META(tree, prop='og:novel:category'))
+        if meta_cat is not None:
+            cat = str(meta_cat)
             if cat:
                 tags.append(cat)
 
@@ -173,7 +199,7 @@ class UUKanshuParser(BaseParser):
             source_url=url,
         )
 
-    def _parse_chapter_list(self, soup: BeautifulSoup, book_id: str) -> List[Chapter]:
+    def _parse_chapter_list(self, tree, book_id: str) -> List[Chapter]:
         """
         Parse the chapter list embedded in the book index page.
         Chapters are in <dl class="book chapterlist"> → <dd> → <a>.
@@ -181,14 +207,14 @@ class UUKanshuParser(BaseParser):
         chapters = []
 
         # All chapter links sit inside dd elements under the chapterlist
-        chapter_links = soup.select("dl.chapterlist dd a")
+        chapter_links = self._X_CHAPTER_LINKS(tree)
         if not chapter_links:
             # Broader fallback
-            chapter_links = soup.select("#list-chapterAll dd a")
+            chapter_links = self._X_CHAPTER_LINKS_FALLBACK(tree)
 
         for idx, link in enumerate(chapter_links):
             href = link.get('href', '')
-            title = link.get_text(strip=True)
+            title = node_text(link)
             if not href or not title:
                 continue
 